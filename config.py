@@ -2,8 +2,10 @@
 Configuration file for Indonesian Stock Trading Bot
 """
 
+from typing import Final
+
 # Indonesian Stock Symbols (Jakarta Stock Exchange)
-INDONESIAN_STOCKS = [
+INDONESIAN_STOCKS: Final = [
     'BBCA.JK',  # Bank Central Asia
     'BBRI.JK',  # Bank Rakyat Indonesia
     'BMRI.JK',  # Bank Mandiri
@@ -17,60 +19,63 @@ INDONESIAN_STOCKS = [
 ]
 
 # Technical Analysis Parameters
-SMA_SHORT_PERIOD = 20  # Short-term Simple Moving Average (increased from 10)
-SMA_LONG_PERIOD = 50   # Long-term Simple Moving Average (increased from 20)
-DATA_PERIOD = "1y"     # Data period to fetch (6 months for better long-term analysis)
+SMA_SHORT_PERIOD: Final = 20  # Short-term Simple Moving Average (increased from 10)
+SMA_LONG_PERIOD: Final = 50   # Long-term Simple Moving Average (increased from 20)
+DATA_PERIOD: Final = "1y"     # Data period to fetch (6 months for better long-term analysis)
+DATA_CACHE_SECONDS: Final = 900  # Fetched price history is reused within the same 15-minute window
 
 # Trading Signal Thresholds
-MIN_VOLUME_THRESHOLD = 1000000  # Minimum volume for signal validity
-MIN_PRICE_CHANGE = 0.03  # Minimum 3% price change for strong signal (increased from 2%)
+MIN_VOLUME_THRESHOLD: Final = 1000000  # Minimum volume for signal validity
+MIN_PRICE_CHANGE: Final = 0.03  # Minimum 3% price change for strong signal (increased from 2%)
 
 # Sell Signal Parameters - LONG TERM FOCUSED
-STOP_LOSS_PERCENTAGE = 0.15  # 15% stop loss (increased from 5% for long-term)
-TAKE_PROFIT_PERCENTAGE = 0.25  # 25% take profit (increased from 10% for long-term)
-RSI_OVERBOUGHT_THRESHOLD = 80  # RSI above 80 for sell signal (increased from 70)
-RSI_OVERSOLD_THRESHOLD = 20   # RSI below 20 for buy signal (decreased from 30)
-RSI_PERIOD = 21  # RSI calculation period (increased from 14 for smoother signals)
+STOP_LOSS_PERCENTAGE: Final = 0.15  # 15% stop loss (increased from 5% for long-term)
+TAKE_PROFIT_PERCENTAGE: Final = 0.25  # 25% take profit (increased from 10% for long-term)
+RSI_OVERBOUGHT_THRESHOLD: Final = 80  # RSI above 80 for sell signal (increased from 70)
+RSI_OVERSOLD_THRESHOLD: Final = 20   # RSI below 20 for buy signal (decreased from 30)
+RSI_PERIOD: Final = 21  # RSI calculation period (increased from 14 for smoother signals)
 
 # Price Action Sell Signals - LONG TERM FOCUSED
-BEARISH_DIVERGENCE_THRESHOLD = 0.05  # 5% divergence for bearish signal (increased from 3%)
-HIGH_VOLUME_SELL_MULTIPLIER = 3.0  # Volume 3x average for strong sell signal (increased from 2x)
+BEARISH_DIVERGENCE_THRESHOLD: Final = 0.05  # 5% divergence for bearish signal (increased from 3%)
+HIGH_VOLUME_SELL_MULTIPLIER: Final = 3.0  # Volume 3x average for strong sell signal (increased from 2x)
 
 # Telegram Settings (will be loaded from .env file)
-TELEGRAM_BOT_TOKEN = None
-TELEGRAM_CHAT_ID = None
+TELEGRAM_BOT_TOKEN: Final = None
+TELEGRAM_CHAT_ID: Final = None
 
 # OpenAI Settings (will be loaded from .env file)
-OPENAI_API_KEY = None
+OPENAI_API_KEY: Final = None
 
 # ChatGPT Confirmation Settings
-ENABLE_CHATGPT_CONFIRMATION = True  # Set to False to disable ChatGPT confirmation
-CHATGPT_MODEL = "gpt-4o-mini"  # More cost-effective model
-CHATGPT_CONFIDENCE_THRESHOLD = 0.7  # Minimum confidence score (0.0-1.0)
-CHATGPT_MAX_RETRIES = 2  # Maximum retries for API calls
-ENABLE_SENTIMENT_ANALYSIS = True  # Enable sentiment analysis in ChatGPT confirmation
-SENTIMENT_WEIGHT = 0.3  # How much sentiment affects final confidence (0.0-1.0)
+ENABLE_CHATGPT_CONFIRMATION: Final = True  # Set to False to disable ChatGPT confirmation
+CHATGPT_MODEL: Final = "gpt-4o-mini"  # More cost-effective model
+CHATGPT_CONFIDENCE_THRESHOLD: Final = 0.7  # Minimum confidence score (0.0-1.0)
+CHATGPT_MAX_RETRIES: Final = 2  # Maximum retries for API calls
+ENABLE_SENTIMENT_ANALYSIS: Final = True  # Enable sentiment analysis in ChatGPT confirmation
+SENTIMENT_WEIGHT: Final = 0.3  # How much sentiment affects final confidence (0.0-1.0)
 
 # ChatGPT Vision Analysis Settings
-ENABLE_CHATGPT_VISION = True  # Enable image analysis with ChatGPT Vision
-CHATGPT_VISION_MODEL = "gpt-4o"  # Vision-capable model (required for image analysis)
-ENABLE_CHART_PATTERN_ANALYSIS = True  # Analyze chart patterns and visual indicators
-ENABLE_TECHNICAL_INDICATOR_VALIDATION = True  # Validate technical indicators visually
-CHART_IMAGE_QUALITY = "high"  # Image quality for analysis: "low", "medium", "high"
+ENABLE_CHATGPT_VISION: Final = True  # Enable image analysis with ChatGPT Vision
+CHATGPT_VISION_MODEL: Final = "gpt-4o"  # Vision-capable model (required for image analysis)
+ENABLE_CHART_PATTERN_ANALYSIS: Final = True  # Analyze chart patterns and visual indicators
+ENABLE_TECHNICAL_INDICATOR_VALIDATION: Final = True  # Validate technical indicators visually
+CHART_IMAGE_QUALITY: Final = "high"  # Image quality for analysis: "low", "medium", "high"
+CHART_DPI: Final = 100  # Render resolution for chart images (14x12in figure -> 1400x1200px)
+CHART_PNG_COMPRESS_LEVEL: Final = 1  # zlib level for chart PNGs (1 = fastest encode, slightly larger files)
 
 # Market Hours (Jakarta time - UTC+7)
-MARKET_OPEN_HOUR = 9
-MARKET_CLOSE_HOUR = 16
+MARKET_OPEN_HOUR: Final = 9
+MARKET_CLOSE_HOUR: Final = 16
 
 # Signal Types
-SIGNAL_BUY = "BUY"
-SIGNAL_SELL = "SELL"
-SIGNAL_STRONG_SELL = "STRONG_SELL"
-SIGNAL_HOLD = "HOLD"
+SIGNAL_BUY: Final = "BUY"
+SIGNAL_SELL: Final = "SELL"
+SIGNAL_STRONG_SELL: Final = "STRONG_SELL"
+SIGNAL_HOLD: Final = "HOLD"
 
 # Watchlist Configuration
-ENABLE_WATCHLIST = True  # Enable watchlist functionality
-WATCHLIST_STOCKS = [
+ENABLE_WATCHLIST: Final = True  # Enable watchlist functionality
+WATCHLIST_STOCKS: Final = [
     # High Priority Stocks (always monitored)
     'BBCA.JK',  # Bank Central Asia
     'BBRI.JK',  # Bank Rakyat Indonesia
@@ -79,14 +84,17 @@ WATCHLIST_STOCKS = [
     'AADI.JK',  # ADI
 ]
 
+# Per-user /watchlist entries from the interactive bot are persisted here across restarts
+USER_WATCHLISTS_FILE: Final = ".state/watchlists.json"
+
 # Watchlist Alert Settings
-WATCHLIST_ALERT_THRESHOLD = 0.5  # Lower confidence threshold for watchlist stocks
-WATCHLIST_PRIORITY_MULTIPLIER = 1.2  # Boost confidence for watchlist stocks
-ENABLE_WATCHLIST_DAILY_SUMMARY = True  # Send daily watchlist summary
-WATCHLIST_PRICE_ALERT_PERCENTAGE = 5.0  # Alert on 5%+ price moves
-ENABLE_WATCHLIST_VOLUME_ALERTS = True  # Alert on high volume for watchlist stocks
+WATCHLIST_ALERT_THRESHOLD: Final = 0.5  # Lower confidence threshold for watchlist stocks
+WATCHLIST_PRIORITY_MULTIPLIER: Final = 1.2  # Boost confidence for watchlist stocks
+ENABLE_WATCHLIST_DAILY_SUMMARY: Final = True  # Send daily watchlist summary
+WATCHLIST_PRICE_ALERT_PERCENTAGE: Final = 5.0  # Alert on 5%+ price moves
+ENABLE_WATCHLIST_VOLUME_ALERTS: Final = True  # Alert on high volume for watchlist stocks
 
 # HOLD Signal Configuration
-ENABLE_HOLD_SIGNALS = True  # Send HOLD signals to Telegram
-HOLD_SIGNAL_CONFIDENCE_THRESHOLD = 0.3  # Lower threshold for HOLD signals (30%)
-SEND_HOLD_SIGNALS_REGARDLESS_OF_CONFIDENCE = True  # Send HOLD signals even if ChatGPT confidence is low 
\ No newline at end of file
+ENABLE_HOLD_SIGNALS: Final = True  # Send HOLD signals to Telegram
+HOLD_SIGNAL_CONFIDENCE_THRESHOLD: Final = 0.3  # Lower threshold for HOLD signals (30%)
+SEND_HOLD_SIGNALS_REGARDLESS_OF_CONFIDENCE: Final = True  # Send HOLD signals even if ChatGPT confidence is low 
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""
+Rolling-window indicator kernels used by the trading bot.
+
+SMA and RSI are computed with running-sum loops compiled by numba when it is
+installed; without numba the same values are produced with pandas rolling means.
+close_indicators() fuses the SMA and RSI loops so the close prices are read once.
+"""
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _sma_running(x, n):
+        """Simple moving average via a running window sum (NaN until the window is full of finite values)"""
+        out = np.full(x.shape[0], np.nan)
+        total = 0.0
+        nan_count = 0
+        for i in range(x.shape[0]):
+            v = x[i]
+            if np.isnan(v):
+                nan_count += 1
+            else:
+                total += v
+            if i >= n:
+                old = x[i - n]
+                if np.isnan(old):
+                    nan_count -= 1
+                else:
+                    total -= old
+            if i >= n - 1 and nan_count == 0:
+                out[i] = total / n
+        return out
+
+    @njit(cache=True)
+    def _rsi_running(x, n):
+        """RSI from running sums of gains and losses over the last n price changes"""
+        size = x.shape[0]
+        out = np.full(size, np.nan)
+        gains = np.zeros(size)
+        losses = np.zeros(size)
+        for i in range(1, size):
+            delta = x[i] - x[i - 1]
+            if delta > 0:
+                gains[i] = delta
+            elif delta < 0:
+                losses[i] = -delta
+
+        gain_sum = 0.0
+        loss_sum = 0.0
+        for i in range(size):
+            gain_sum += gains[i]
+            loss_sum += losses[i]
+            if i >= n:
+                gain_sum -= gains[i - n]
+                loss_sum -= losses[i - n]
+            if i >= n - 1:
+                # Running sums can drift slightly below zero after subtraction
+                avg_gain = max(gain_sum, 0.0) / n
+                avg_loss = max(loss_sum, 0.0) / n
+                if avg_loss > 0:
+                    out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+                elif avg_gain > 0:
+                    out[i] = 100.0
+        return out
+
+    @njit(cache=True)
+    def _close_indicators_running(x, short_n, long_n, rsi_n):
+        """Short SMA, long SMA and RSI of one price array in a single pass"""
+        size = x.shape[0]
+        sma_short = np.full(size, np.nan)
+        sma_long = np.full(size, np.nan)
+        rsi_out = np.full(size, np.nan)
+        gains = np.zeros(size)
+        losses = np.zeros(size)
+        short_total = 0.0
+        long_total = 0.0
+        short_nans = 0
+        long_nans = 0
+        gain_sum = 0.0
+        loss_sum = 0.0
+        for i in range(size):
+            v = x[i]
+            if np.isnan(v):
+                short_nans += 1
+                long_nans += 1
+            else:
+                short_total += v
+                long_total += v
+            if i >= short_n:
+                old = x[i - short_n]
+                if np.isnan(old):
+                    short_nans -= 1
+                else:
+                    short_total -= old
+            if i >= long_n:
+                old = x[i - long_n]
+                if np.isnan(old):
+                    long_nans -= 1
+                else:
+                    long_total -= old
+            if i >= short_n - 1 and short_nans == 0:
+                sma_short[i] = short_total / short_n
+            if i >= long_n - 1 and long_nans == 0:
+                sma_long[i] = long_total / long_n
+
+            if i > 0:
+                delta = v - x[i - 1]
+                if delta > 0:
+                    gains[i] = delta
+                elif delta < 0:
+                    losses[i] = -delta
+            gain_sum += gains[i]
+            loss_sum += losses[i]
+            if i >= rsi_n:
+                gain_sum -= gains[i - rsi_n]
+                loss_sum -= losses[i - rsi_n]
+            if i >= rsi_n - 1:
+                avg_gain = max(gain_sum, 0.0) / rsi_n
+                avg_loss = max(loss_sum, 0.0) / rsi_n
+                if avg_loss > 0:
+                    rsi_out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+                elif avg_gain > 0:
+                    rsi_out[i] = 100.0
+        return sma_short, sma_long, rsi_out
+
+
+def sma(series: pd.Series, window: int) -> pd.Series:
+    """Simple moving average of a series over a fixed window"""
+    if NUMBA_AVAILABLE:
+        values = _sma_running(series.to_numpy(dtype=np.float64), window)
+        return pd.Series(values, index=series.index, name=series.name)
+    return series.rolling(window=window).mean()
+
+
+def rsi(close: pd.Series, period: int) -> pd.Series:
+    """Relative Strength Index using simple rolling averages of gains and losses"""
+    if NUMBA_AVAILABLE:
+        values = _rsi_running(close.to_numpy(dtype=np.float64), period)
+        return pd.Series(values, index=close.index, name=close.name)
+
+    delta = close.diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    rs = gain / loss
+    return 100 - (100 / (1 + rs))
+
+
+def close_indicators(close: pd.Series, short_window: int, long_window: int, rsi_period: int):
+    """Short SMA, long SMA and RSI of a close series, computed together in one pass when numba is available"""
+    if NUMBA_AVAILABLE:
+        values = _close_indicators_running(close.to_numpy(dtype=np.float64), short_window, long_window, rsi_period)
+        return tuple(pd.Series(column, index=close.index, name=close.name) for column in values)
+    return sma(close, short_window), sma(close, long_window), rsi(close, rsi_period)
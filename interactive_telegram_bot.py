@@ -6,16 +6,22 @@ Responds to commands for real-time crypto and stock analysis
 
 import asyncio
 import logging
+import re
+import time
 from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List
-from telegram import Update, Bot
-from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters
+import orjson
+from telegram import Update
+from telegram.ext import AIORateLimiter, Application, CommandHandler, ContextTypes, MessageHandler, filters
 from telegram.error import TelegramError
+from telegram.request import HTTPXRequest
 import os
 from dotenv import load_dotenv
 
 from trading_bot import IndonesianStockBot
-from config import WATCHLIST_STOCKS
+from config import WATCHLIST_STOCKS, USER_WATCHLISTS_FILE
 
 # Load environment variables
 load_dotenv()
@@ -27,43 +33,67 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class InteractiveTradingBot:
-    """Interactive Telegram bot for real-time trading analysis"""
-    
-    def __init__(self):
-        self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
-        self.chat_id = os.getenv('TELEGRAM_CHAT_ID')
-        
-        if not self.bot_token:
-            raise ValueError("Please set TELEGRAM_BOT_TOKEN in .env file")
-        
-        self.trading_bot = IndonesianStockBot()
-        self.user_watchlists = {}  # Store user-specific watchlists
-        
-        # Initialize Telegram application
-        self.application = Application.builder().token(self.bot_token).build()
-        
-        # Add command handlers
-        self.setup_handlers()
-        
-        logger.info("Interactive Trading Bot initialized")
-    
-    def setup_handlers(self):
-        """Setup command handlers"""
-        # Command handlers
-        self.application.add_handler(CommandHandler("start", self.start_command))
-        self.application.add_handler(CommandHandler("help", self.help_command))
-        self.application.add_handler(CommandHandler("analyze", self.analyze_command))
-        self.application.add_handler(CommandHandler("signals", self.signals_command))
-        self.application.add_handler(CommandHandler("watchlist", self.watchlist_command))
-        self.application.add_handler(CommandHandler("notifications", self.notifications_command))
-        
-        # Handle regular messages (for symbols without commands)
-        self.application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_message))
-    
-    async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /start command"""
-        welcome_message = """
+# Upper bound on analyses running at once (keeps yfinance/OpenAI under their rate limits)
+MAX_CONCURRENT_ANALYSES = 5
+
+# Updates processed in parallel, so a long /analyze doesn't hold up other users' commands
+CONCURRENT_UPDATES = 32
+
+# Outbound Bot API connections (replies/edits from concurrent handlers) and their timeouts in seconds
+TELEGRAM_CONNECTION_POOL_SIZE = 64
+TELEGRAM_CONNECT_TIMEOUT = 10.0
+TELEGRAM_READ_TIMEOUT = 30.0
+
+# Outgoing calls are queued to stay within Telegram's flood limits instead of tripping 429 retries
+TELEGRAM_OVERALL_MAX_RATE = 30  # messages per second across all chats
+TELEGRAM_GROUP_MAX_RATE = 20  # messages per minute per group chat
+
+# Address the webhook server binds to when WEBHOOK_URL is set, and its port unless PORT overrides it
+WEBHOOK_LISTEN = '0.0.0.0'
+WEBHOOK_PORT = 8443
+
+# Watchlist changes made within this many seconds are written to disk together
+WATCHLISTS_FLUSH_INTERVAL = 2.0
+
+# Seconds an analysis result is reused for repeated requests of the same symbol
+ANALYSIS_CACHE_TTL = 60
+
+# Common crypto tickers and their Yahoo Finance USD pairs
+CRYPTO_PAIRS = {
+    'BTC': 'BTC-USD', 'ETH': 'ETH-USD', 'BNB': 'BNB-USD',
+    'ADA': 'ADA-USD', 'SOL': 'SOL-USD', 'DOGE': 'DOGE-USD',
+    'XRP': 'XRP-USD', 'DOT': 'DOT-USD', 'AVAX': 'AVAX-USD',
+    'MATIC': 'MATIC-USD', 'LINK': 'LINK-USD', 'UNI': 'UNI-USD',
+    'LTC': 'LTC-USD', 'BCH': 'BCH-USD', 'ATOM': 'ATOM-USD',
+    'FTT': 'FTT-USD', 'NEAR': 'NEAR-USD', 'ALGO': 'ALGO-USD',
+    'VET': 'VET-USD', 'ICP': 'ICP-USD', 'FIL': 'FIL-USD',
+    'TRX': 'TRX-USD', 'ETC': 'ETC-USD', 'XLM': 'XLM-USD',
+    'MANA': 'MANA-USD', 'SAND': 'SAND-USD', 'CRO': 'CRO-USD'
+}
+
+# Bare tickers recognised as crypto by is_crypto
+CRYPTO_SYMBOLS = frozenset([
+    'BTC', 'ETH', 'ADA', 'DOT', 'MATIC', 'SOL', 'AVAX', 'LINK', 'UNI', 'AAVE', 'COMP', 'MKR', 'SNX',
+    'YFI', 'CRV', 'BAL', 'SUSHI', 'LTC', 'BCH', 'XRP', 'BNB', 'DOGE', 'SHIB', 'ATOM'
+])
+
+# Suffixes of symbols that are already in Yahoo Finance form
+FORMATTED_SYMBOL_SUFFIXES = ('.JK', '-USD', '-USDT')
+
+# Bare codes need at least one letter to be treated as an IDX ticker (checked after upper())
+LETTER_PATTERN = re.compile(r'[A-Z]')
+
+# Free-text messages treated as a symbol: up to 10 letters/digits/'.'/'-' with at least one letter or digit
+SYMBOL_PATTERN = re.compile(r'(?=[.\-]*[A-Za-z0-9])[A-Za-z0-9.\-]{1,10}')
+
+# Exchange-style pair messages such as "BTC/USDT" (checked after upper()), mapped to Yahoo's BASE-QUOTE form
+PAIR_PATTERN = re.compile(r'([A-Z0-9]{2,10})\s*/\s*([A-Z0-9]{2,10})')
+
+# Yahoo Finance quotes crypto against USD rather than dollar stablecoins, so "BTC/USDT" becomes "BTC-USD"
+USD_STABLECOIN_QUOTES = frozenset({'USDT', 'USDC', 'BUSD'})
+
+# Static command replies
+WELCOME_MESSAGE = """
 🚀 **Welcome to Smart Trading Bot!**
 
 Your AI-powered crypto & stock analysis companion is ready!
@@ -91,11 +121,8 @@ Your AI-powered crypto & stock analysis companion is ready!
 
 Ready to start? Try `/analyze BTC` or `/help` for more info!
         """
-        await update.message.reply_text(welcome_message, parse_mode='Markdown')
-    
-    async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /help command"""
-        help_message = """
+
+HELP_MESSAGE = """
 📚 **SMART TRADING BOT - HELP GUIDE**
 
 🔧 **ANALYSIS COMMANDS:**
@@ -141,38 +168,180 @@ Just type any symbol directly (without /) for instant analysis:
 
 Need help? Just ask! 🤖
         """
-        await update.message.reply_text(help_message, parse_mode='Markdown')
+
+STARTUP_MESSAGE = """
+🚀 **Interactive Trading Bot Started!**
+
+Ready to analyze crypto & stocks with AI-powered insights!
+
+Type `/help` to see all commands or just send a symbol like `BTC` for quick analysis.
+                """
+
+NOTIFICATIONS_MESSAGE = """
+🔔 **NOTIFICATION SETTINGS**
+
+📊 **Current Status:** Enabled ✅
+🎯 **Signal Alerts:** On
+📈 **Price Alerts:** On (5%+ moves)
+📊 **Volume Alerts:** On (2x+ volume)
+
+**Available Commands:**
+• `/notifications on` - Enable all notifications
+• `/notifications off` - Disable notifications
+• `/notifications signals` - Only signal notifications
+• `/notifications price` - Only price alerts
+
+💡 All analysis includes AI confirmation with 70%+ confidence threshold.
+        """
+
+class InteractiveTradingBot:
+    """Interactive Telegram bot for real-time trading analysis"""
+    
+    SIGNAL_EMOJI = MappingProxyType({'BUY': "🟢", 'SELL': "🔴", 'STRONG_SELL': "🚨", 'HOLD': "🟡"})
+    STRENGTH_EMOJI = MappingProxyType({'VERY_STRONG': "🚨🚨", 'STRONG': "💪", 'MODERATE': "👍", 'WEAK': "👎"})
+    
+    def __init__(self):
+        self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
+        self.chat_id = os.getenv('TELEGRAM_CHAT_ID')
+        self.webhook_url = os.getenv('WEBHOOK_URL')  # Public HTTPS base URL; polling is used when unset
+        
+        if not self.bot_token:
+            raise ValueError("Please set TELEGRAM_BOT_TOKEN in .env file")
+        
+        self.trading_bot = IndonesianStockBot()
+        self._watchlists_path = Path(USER_WATCHLISTS_FILE)
+        self.user_watchlists = self._load_watchlists()  # user id -> {symbol: None}, an insertion-ordered set
+        self._watchlists_write_lock = asyncio.Lock()
+        self._watchlists_dirty = asyncio.Event()  # Set by watchlist changes, cleared by the flusher
+        self._watchlists_flusher = None
+        self._watchlists_write = None  # Latest write started by the flusher, awaited on shutdown
+        self._background_tasks = set()
+        self._analyze_sem = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+        self._analysis_cache = {}  # symbol -> (monotonic timestamp, signal_info)
+        self._inflight_analyses = {}  # symbol -> future of the analysis currently running for it
+        
+        # Initialize Telegram application
+        self.application = (
+            Application.builder()
+            .token(self.bot_token)
+            .request(HTTPXRequest(
+                connection_pool_size=TELEGRAM_CONNECTION_POOL_SIZE,
+                connect_timeout=TELEGRAM_CONNECT_TIMEOUT,
+                read_timeout=TELEGRAM_READ_TIMEOUT
+            ))
+            .rate_limiter(AIORateLimiter(
+                overall_max_rate=TELEGRAM_OVERALL_MAX_RATE,
+                overall_time_period=1,
+                group_max_rate=TELEGRAM_GROUP_MAX_RATE,
+                group_time_period=60
+            ))
+            .concurrent_updates(CONCURRENT_UPDATES)
+            .post_init(self._post_init)
+            .post_shutdown(self._post_shutdown)
+            .build()
+        )
+        # Signals pushed by the trading bot go through the application's bot too, sharing its
+        # connection pool and rate limiter instead of opening a second client for the same token
+        self.trading_bot.telegram_bot = self.application.bot
+        
+        # Add command handlers
+        self.setup_handlers()
+        
+        logger.info("Interactive Trading Bot initialized")
+    
+    def setup_handlers(self):
+        """Setup command handlers"""
+        # Command handlers (the ones that run analyses are non-blocking, so a slow fetch/chart
+        # doesn't hold its update slot while the next update from the same chat waits)
+        self.application.add_handler(CommandHandler("start", self.start_command))
+        self.application.add_handler(CommandHandler("help", self.help_command))
+        self.application.add_handler(CommandHandler("analyze", self.analyze_command, block=False))
+        self.application.add_handler(CommandHandler("signals", self.signals_command, block=False))
+        self.application.add_handler(CommandHandler("watchlist", self.watchlist_command, block=False))
+        self.application.add_handler(CommandHandler("notifications", self.notifications_command))
+        
+        # Handle regular messages (for symbols without commands)
+        self.application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_message, block=False))
+    
+    async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /start command"""
+        await update.message.reply_text(WELCOME_MESSAGE, parse_mode='Markdown')
+    
+    async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /help command"""
+        await update.message.reply_text(HELP_MESSAGE, parse_mode='Markdown')
+    
+    def _load_watchlists(self) -> Dict[int, Dict[str, None]]:
+        """Load persisted user watchlists (JSON object keys are user ids as strings)"""
+        try:
+            stored = orjson.loads(self._watchlists_path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Could not load watchlists from %s: %s", self._watchlists_path, e)
+            return {}
+        
+        logger.info("Loaded watchlists for %d users from %s", len(stored), self._watchlists_path)
+        return {int(user_id): dict.fromkeys(symbols) for user_id, symbols in stored.items()}
+    
+    def _write_watchlists(self, payload: bytes):
+        """Atomically replace the watchlists file with the given JSON payload"""
+        self._watchlists_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._watchlists_path.with_suffix('.tmp')
+        tmp_path.write_bytes(payload)
+        tmp_path.replace(self._watchlists_path)
+    
+    async def _persist_watchlists(self):
+        """Write the current watchlists to disk without blocking the event loop"""
+        async with self._watchlists_write_lock:
+            # Serialize on the loop so the snapshot is consistent, write in a worker thread
+            # (OPT_NON_STR_KEYS writes the int user ids as string keys, the same file json.dumps produced)
+            payload = orjson.dumps(
+                {user_id: list(watchlist) for user_id, watchlist in self.user_watchlists.items()},
+                option=orjson.OPT_NON_STR_KEYS
+            )
+            try:
+                await asyncio.to_thread(self._write_watchlists, payload)
+            except OSError as e:
+                logger.error("Could not save watchlists to %s: %s", self._watchlists_path, e)
+    
+    def _schedule_persist_watchlists(self):
+        """Mark the watchlists as changed; the flusher task writes them out"""
+        self._watchlists_dirty.set()
+    
+    async def _flush_watchlists(self):
+        """Write watchlist changes to disk, coalescing bursts of changes into one write per interval"""
+        while True:
+            await self._watchlists_dirty.wait()
+            self._watchlists_dirty.clear()
+            # Shielded so shutdown never interrupts a write halfway; _post_shutdown awaits the task
+            self._watchlists_write = asyncio.ensure_future(self._persist_watchlists())
+            await asyncio.shield(self._watchlists_write)
+            await asyncio.sleep(WATCHLISTS_FLUSH_INTERVAL)
     
     def format_symbol(self, symbol: str) -> str:
         """Format symbol for analysis"""
-        symbol = symbol.upper().strip()
+        # Callers pass PTB-tokenized args or already-stripped text, so only case needs normalizing
+        symbol = symbol.upper()
         
         # Auto-format common crypto symbols
-        crypto_pairs = {
-            'BTC': 'BTC-USD', 'ETH': 'ETH-USD', 'BNB': 'BNB-USD',
-            'ADA': 'ADA-USD', 'SOL': 'SOL-USD', 'DOGE': 'DOGE-USD',
-            'XRP': 'XRP-USD', 'DOT': 'DOT-USD', 'AVAX': 'AVAX-USD',
-            'MATIC': 'MATIC-USD', 'LINK': 'LINK-USD', 'UNI': 'UNI-USD',
-            'LTC': 'LTC-USD', 'BCH': 'BCH-USD', 'ATOM': 'ATOM-USD',
-            'FTT': 'FTT-USD', 'NEAR': 'NEAR-USD', 'ALGO': 'ALGO-USD',
-            'VET': 'VET-USD', 'ICP': 'ICP-USD', 'FIL': 'FIL-USD',
-            'TRX': 'TRX-USD', 'ETC': 'ETC-USD', 'XLM': 'XLM-USD',
-            'MANA': 'MANA-USD', 'SAND': 'SAND-USD', 'CRO': 'CRO-USD'
-        }
-        
-        if symbol in crypto_pairs:
-            return crypto_pairs[symbol]
-        elif not symbol.endswith('.JK') and not symbol.endswith('-USD') and not symbol.endswith('-USDT'):
+        if symbol in CRYPTO_PAIRS:
+            return CRYPTO_PAIRS[symbol]
+        elif not symbol.endswith(FORMATTED_SYMBOL_SUFFIXES):
             # If it's not already formatted and not obviously crypto, assume Indonesian stock
-            if any(char.isalpha() for char in symbol) and len(symbol) <= 6:
+            if len(symbol) <= 6 and LETTER_PATTERN.search(symbol):
                 return symbol + '.JK'
         
         return symbol
     
     def is_crypto(self, symbol: str) -> bool:
         """Check if symbol is a cryptocurrency"""
-        crypto_symbols = ['BTC', 'ETH', 'ADA', 'DOT', 'MATIC', 'SOL', 'AVAX', 'LINK', 'UNI', 'AAVE', 'COMP', 'MKR', 'SNX', 'YFI', 'CRV', 'BAL', 'SUSHI', 'LTC', 'BCH', 'XRP', 'BNB', 'DOGE', 'SHIB', 'ATOM']
-        return symbol.endswith('-USD') or symbol in crypto_symbols
+        return symbol.endswith('-USD') or symbol in CRYPTO_SYMBOLS
+    
+    @staticmethod
+    def _price_formatter(is_crypto: bool):
+        """Return a price formatter: USD with cents for crypto, IDR for stocks"""
+        return "${:,.2f}".format if is_crypto else "{:,} IDR".format
     
     def get_asset_type(self, symbol: str) -> str:
         """Get asset type description for display"""
@@ -202,41 +371,38 @@ Need help? Just ask! 🤖
         is_crypto = self.is_crypto(formatted_symbol)
         asset_type = self.get_asset_type(formatted_symbol)
         
-        # Send "analyzing" message
-        analyzing_msg = await update.message.reply_text(
-            f"🔍 Analyzing {formatted_symbol} ({asset_type})...\n"
-            f"⏳ Fetching data and running AI analysis..."
-        )
+        # A cached result is answered with a single reply. Otherwise the analysis starts while the
+        # "analyzing" message is still in flight, and that message is edited with the result
+        cached = self._get_cached_analysis(formatted_symbol)
+        if cached:
+            respond = update.message.reply_text
+        else:
+            analysis_task = asyncio.create_task(self._cached_analyze(formatted_symbol))
+            try:
+                analyzing_msg = await update.message.reply_text(
+                    f"🔍 Analyzing {formatted_symbol} ({asset_type})...\n"
+                    f"⏳ Fetching data and running AI analysis..."
+                )
+            except BaseException:
+                # Nothing will await the task now; the shared analysis behind it keeps running and is cached
+                analysis_task.cancel()
+                raise
+            respond = analyzing_msg.edit_text
         
         try:
-            # Perform analysis
-            signal_info = await self.trading_bot.analyze_stock(formatted_symbol)
+            # Wait for the analysis
+            signal_info = cached or await analysis_task
             
             if signal_info:
                 # Format result message
-                signal_emoji = {
-                    'BUY': "🟢",
-                    'SELL': "🔴", 
-                    'STRONG_SELL': "🚨",
-                    'HOLD': "🟡"
-                }.get(signal_info['signal'], "⚪")
+                signal_emoji = self.SIGNAL_EMOJI.get(signal_info['signal'], "⚪")
+                strength_emoji = self.STRENGTH_EMOJI.get(signal_info['strength'], "")
                 
-                strength_emoji = {
-                    'VERY_STRONG': "🚨🚨",
-                    'STRONG': "💪",
-                    'MODERATE': "👍",
-                    'WEAK': "👎"
-                }.get(signal_info['strength'], "")
-                
-                # Currency formatting
-                if is_crypto:
-                    price_format = f"${signal_info['current_price']:,.2f}"
-                    sl_format = f"${signal_info['stop_loss_price']:,.2f}"
-                    tp_format = f"${signal_info['take_profit_price']:,.2f}"
-                else:
-                    price_format = f"{signal_info['current_price']:,} IDR"
-                    sl_format = f"{signal_info['stop_loss_price']:,} IDR"
-                    tp_format = f"{signal_info['take_profit_price']:,} IDR"
+                # Currency formatting (format chosen once for all price fields)
+                fmt_price = self._price_formatter(is_crypto)
+                price_format = fmt_price(signal_info['current_price'])
+                sl_format = fmt_price(signal_info['stop_loss_price'])
+                tp_format = fmt_price(signal_info['take_profit_price'])
                 
                 result_message = f"""
 {signal_emoji} **{formatted_symbol} ANALYSIS** {strength_emoji}
@@ -249,8 +415,8 @@ Need help? Just ask! 🤖
 📊 **Technical Levels:**
 🎯 **Stop Loss:** {sl_format} (-15%)
 🎯 **Take Profit:** {tp_format} (+25%)
-📈 **SMA 20:** {f"${signal_info['sma_short']:,.2f}" if is_crypto else f"{signal_info['sma_short']:,} IDR"}
-📈 **SMA 50:** {f"${signal_info['sma_long']:,.2f}" if is_crypto else f"{signal_info['sma_long']:,} IDR"}
+📈 **SMA 20:** {fmt_price(signal_info['sma_short'])}
+📈 **SMA 50:** {fmt_price(signal_info['sma_long'])}
 
 ✅ **Valid Signal:** {'Yes' if signal_info['valid'] else 'No'}
 💪 **Strength:** {signal_info['strength']}
@@ -258,13 +424,13 @@ Need help? Just ask! 🤖
 ⚠️ *This is educational analysis. DYOR before trading!*
                 """
                 
-                # Edit the analyzing message with results
-                await analyzing_msg.edit_text(result_message, parse_mode='Markdown')
+                # Edit the analyzing message with results (or reply with them)
+                await respond(result_message, parse_mode='Markdown')
                 
-                logger.info(f"Analysis sent for {formatted_symbol}: {signal_info['signal']}")
+                logger.info("Analysis sent for %s: %s", formatted_symbol, signal_info['signal'])
                 
             else:
-                await analyzing_msg.edit_text(
+                await respond(
                     f"❌ Could not analyze {formatted_symbol}\n\n"
                     f"Please check if the symbol is correct:\n"
                     f"• Crypto: BTC, ETH-USD, BNB-USD\n"
@@ -272,19 +438,56 @@ Need help? Just ask! 🤖
                 )
                 
         except Exception as e:
-            logger.error(f"Error analyzing {formatted_symbol}: {e}")
-            await analyzing_msg.edit_text(
+            logger.error("Error analyzing %s: %s", formatted_symbol, e)
+            await respond(
                 f"❌ Error analyzing {formatted_symbol}\n"
                 f"Please try again or check the symbol format."
             )
     
+    async def _analyze_limited(self, symbol: str, data=None):
+        """Analyze a symbol while holding one of the shared analysis slots"""
+        async with self._analyze_sem:
+            return await self.trading_bot.analyze_stock(symbol, data=data)
+    
+    def _get_cached_analysis(self, symbol: str, ttl: float = ANALYSIS_CACHE_TTL):
+        """Return the cached analysis for the symbol if it is younger than ttl seconds"""
+        cached = self._analysis_cache.get(symbol)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        return None
+    
+    async def _cached_analyze(self, symbol: str, ttl: float = ANALYSIS_CACHE_TTL, data=None):
+        """Return a recent analysis for the symbol, running at most one analysis per symbol at a time"""
+        cached = self._get_cached_analysis(symbol, ttl)
+        if cached:
+            return cached
+        
+        # Join the analysis already running for this symbol (from this or any other user) if there is one,
+        # so repeated /analyze spam shares a single result - including a failed one
+        inflight = self._inflight_analyses.get(symbol)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._analyze_and_cache(symbol, data))
+            self._inflight_analyses[symbol] = inflight
+            inflight.add_done_callback(lambda _: self._inflight_analyses.pop(symbol, None))
+        
+        # Shield so one cancelled handler doesn't cancel the analysis the others are waiting on
+        return await asyncio.shield(inflight)
+    
+    async def _analyze_and_cache(self, symbol: str, data=None):
+        """Run an analysis and cache it if it produced a result"""
+        signal_info = await self._analyze_limited(symbol, data=data)
+        if signal_info:
+            self._analysis_cache[symbol] = (time.monotonic(), signal_info)
+        return signal_info
+    
     async def signals_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /signals command"""
         await update.message.reply_text("🔄 Getting signals for watchlist assets...")
         
         # Get user's watchlist or use default
         user_id = update.effective_user.id
-        watchlist = self.user_watchlists.get(user_id, WATCHLIST_STOCKS[:3])  # Default to first 3
+        # Analyses are gated by the shared semaphore, so the whole watchlist can be fanned out at once
+        watchlist = list(self.user_watchlists.get(user_id, WATCHLIST_STOCKS))
         
         if not watchlist:
             await update.message.reply_text(
@@ -293,31 +496,32 @@ Need help? Just ask! 🤖
             )
             return
         
+        # Fetch every symbol that isn't cached in one batched download instead of one request each
+        missing = [symbol for symbol in watchlist if not self._get_cached_analysis(symbol)]
+        prefetched = {}
+        if len(missing) > 1:
+            prefetched = await self.trading_bot.run_blocking(self.trading_bot.fetch_stocks_data, missing)
+        
+        results = await asyncio.gather(
+            *(self._cached_analyze(symbol, data=prefetched.get(symbol)) for symbol in watchlist),
+            return_exceptions=True
+        )
+        
         signals = []
-        for symbol in watchlist:
-            try:
-                signal_info = await self.trading_bot.analyze_stock(symbol)
-                if signal_info:
-                    signals.append(signal_info)
-            except Exception as e:
-                logger.error(f"Error getting signal for {symbol}: {e}")
+        for symbol, result in zip(watchlist, results):
+            if isinstance(result, Exception):
+                logger.error("Error getting signal for %s: %s", symbol, result)
+            elif result:
+                signals.append(result)
         
         if signals:
-            message = "📊 **WATCHLIST SIGNALS**\n\n"
-            
-            for signal in signals:
-                signal_emoji = {
-                    'BUY': "🟢", 'SELL': "🔴", 
-                    'STRONG_SELL': "🚨", 'HOLD': "🟡"
-                }.get(signal['signal'], "⚪")
-                
-                is_crypto = self.is_crypto(signal['symbol'])
-                price_format = f"${signal['current_price']:,.2f}" if is_crypto else f"{signal['current_price']:,} IDR"
-                
-                message += f"{signal_emoji} **{signal['symbol']}**: {signal['signal']}\n"
-                message += f"💰 {price_format} ({signal['price_change']:+.2f}%) | RSI: {signal['rsi']:.0f}\n\n"
-            
-            message += "Use `/analyze <symbol>` for detailed analysis!"
+            entries = "".join(
+                f"{self.SIGNAL_EMOJI.get(signal['signal'], '⚪')} **{signal['symbol']}**: {signal['signal']}\n"
+                f"💰 {self._price_formatter(self.is_crypto(signal['symbol']))(signal['current_price'])} "
+                f"({signal['price_change']:+.2f}%) | RSI: {signal['rsi']:.0f}\n\n"
+                for signal in signals
+            )
+            message = f"📊 **WATCHLIST SIGNALS**\n\n{entries}Use `/analyze <symbol>` for detailed analysis!"
             await update.message.reply_text(message, parse_mode='Markdown')
         else:
             await update.message.reply_text("❌ Could not get signals. Please try again.")
@@ -328,18 +532,20 @@ Need help? Just ask! 🤖
         
         if not context.args:
             # Show current watchlist
-            watchlist = self.user_watchlists.get(user_id, WATCHLIST_STOCKS[:5])
-            
-            message = "📋 **YOUR WATCHLIST**\n\n"
-            for i, symbol in enumerate(watchlist, 1):
-                asset_type = "🪙" if self.is_crypto(symbol) else "📊"
-                message += f"{i}. {asset_type} {symbol}\n"
+            watchlist = self.user_watchlists.get(user_id, WATCHLIST_STOCKS)
             
-            message += f"\n📊 Total: {len(watchlist)} assets\n\n"
-            message += "**Commands:**\n"
-            message += "• `/watchlist add BTC` - Add asset\n"
-            message += "• `/watchlist remove ETH` - Remove asset\n"
-            message += "• `/watchlist clear` - Clear all"
+            entries = "".join(
+                f"{i}. {'🪙' if self.is_crypto(symbol) else '📊'} {symbol}\n"
+                for i, symbol in enumerate(watchlist, 1)
+            )
+            message = (
+                f"📋 **YOUR WATCHLIST**\n\n{entries}"
+                f"\n📊 Total: {len(watchlist)} assets\n\n"
+                "**Commands:**\n"
+                "• `/watchlist add BTC` - Add asset\n"
+                "• `/watchlist remove ETH` - Remove asset\n"
+                "• `/watchlist clear` - Clear all"
+            )
             
             await update.message.reply_text(message, parse_mode='Markdown')
             
@@ -347,11 +553,11 @@ Need help? Just ask! 🤖
             # Add to watchlist
             symbol = self.format_symbol(context.args[1])
             
-            if user_id not in self.user_watchlists:
-                self.user_watchlists[user_id] = []
+            watchlist = self.user_watchlists.setdefault(user_id, {})
             
-            if symbol not in self.user_watchlists[user_id]:
-                self.user_watchlists[user_id].append(symbol)
+            if symbol not in watchlist:
+                watchlist[symbol] = None
+                self._schedule_persist_watchlists()
                 asset_type = "cryptocurrency" if self.is_crypto(symbol) else "stock"
                 await update.message.reply_text(f"✅ Added {symbol} ({asset_type}) to your watchlist!")
             else:
@@ -361,15 +567,19 @@ Need help? Just ask! 🤖
             # Remove from watchlist
             symbol = self.format_symbol(context.args[1])
             
-            if user_id in self.user_watchlists and symbol in self.user_watchlists[user_id]:
-                self.user_watchlists[user_id].remove(symbol)
+            watchlist = self.user_watchlists.get(user_id)
+            
+            if watchlist is not None and symbol in watchlist:
+                del watchlist[symbol]
+                self._schedule_persist_watchlists()
                 await update.message.reply_text(f"✅ Removed {symbol} from your watchlist!")
             else:
                 await update.message.reply_text(f"ℹ️ {symbol} is not in your watchlist.")
                 
         elif context.args[0].lower() == 'clear':
             # Clear watchlist
-            self.user_watchlists[user_id] = []
+            self.user_watchlists[user_id] = {}
+            self._schedule_persist_watchlists()
             await update.message.reply_text("✅ Cleared your watchlist!")
             
         else:
@@ -383,43 +593,44 @@ Need help? Just ask! 🤖
     
     async def notifications_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /notifications command"""
-        message = """
-🔔 **NOTIFICATION SETTINGS**
-
-📊 **Current Status:** Enabled ✅
-🎯 **Signal Alerts:** On
-📈 **Price Alerts:** On (5%+ moves)
-📊 **Volume Alerts:** On (2x+ volume)
-
-**Available Commands:**
-• `/notifications on` - Enable all notifications
-• `/notifications off` - Disable notifications
-• `/notifications signals` - Only signal notifications
-• `/notifications price` - Only price alerts
-
-💡 All analysis includes AI confirmation with 70%+ confidence threshold.
-        """
-        await update.message.reply_text(message, parse_mode='Markdown')
+        await update.message.reply_text(NOTIFICATIONS_MESSAGE, parse_mode='Markdown')
     
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle regular messages (symbols without commands)"""
         text = update.message.text.strip()
+        upper_text = text.upper()
+        
+        # "BASE/QUOTE" pairs are rewritten to the dashed form that /analyze also accepts
+        pair = PAIR_PATTERN.fullmatch(upper_text)
+        if pair:
+            quote = 'USD' if pair[2] in USD_STABLECOIN_QUOTES else pair[2]
+            text = upper_text = f"{pair[1]}-{quote}"
         
         # Check if it looks like a symbol
-        if len(text) <= 10 and text.replace('-', '').replace('.', '').isalnum():
+        if pair or SYMBOL_PATTERN.fullmatch(text):
             # Treat as symbol for quick analysis
-            formatted_symbol = self.format_symbol(text)
+            formatted_symbol = self.format_symbol(upper_text)
             
-            # Quick analysis message
-            quick_msg = await update.message.reply_text(f"🔍 Quick analysis: {formatted_symbol}...")
+            # Quick analysis message, sent while the analysis is already running (skipped for cached results)
+            cached = self._get_cached_analysis(formatted_symbol)
+            if cached:
+                respond = update.message.reply_text
+            else:
+                analysis_task = asyncio.create_task(self._cached_analyze(formatted_symbol))
+                try:
+                    quick_msg = await update.message.reply_text(f"🔍 Quick analysis: {formatted_symbol}...")
+                except BaseException:
+                    analysis_task.cancel()
+                    raise
+                respond = quick_msg.edit_text
             
             try:
-                signal_info = await self.trading_bot.analyze_stock(formatted_symbol)
+                signal_info = cached or await analysis_task
                 
                 if signal_info:
-                    signal_emoji = {'BUY': "🟢", 'SELL': "🔴", 'STRONG_SELL': "🚨", 'HOLD': "🟡"}.get(signal_info['signal'], "⚪")
+                    signal_emoji = self.SIGNAL_EMOJI.get(signal_info['signal'], "⚪")
                     is_crypto = self.is_crypto(formatted_symbol)
-                    price = f"${signal_info['current_price']:,.2f}" if is_crypto else f"{signal_info['current_price']:,} IDR"
+                    price = self._price_formatter(is_crypto)(signal_info['current_price'])
                     
                     quick_result = f"""
 {signal_emoji} **{formatted_symbol}**: {signal_info['signal']}
@@ -428,60 +639,78 @@ Need help? Just ask! 🤖
 
 Use `/analyze {text}` for detailed analysis!
                     """
-                    await quick_msg.edit_text(quick_result, parse_mode='Markdown')
+                    await respond(quick_result, parse_mode='Markdown')
                 else:
-                    await quick_msg.edit_text(f"❌ Could not analyze {formatted_symbol}")
+                    await respond(f"❌ Could not analyze {formatted_symbol}")
                     
             except Exception as e:
-                await quick_msg.edit_text(f"❌ Error analyzing {formatted_symbol}")
+                await respond(f"❌ Error analyzing {formatted_symbol}")
         else:
             # Not a symbol, provide help
             await update.message.reply_text(
                 "💡 Send a symbol for quick analysis (e.g., `BTC`, `ETH`, `ANTM.JK`) or use `/help` for commands!"
             )
     
-    async def run(self):
-        """Run the interactive bot"""
-        logger.info("Starting Interactive Trading Bot...")
+    async def _post_init(self, application: Application):
+        """Start the watchlist flusher and announce startup once the application is initialized"""
+        self._watchlists_flusher = asyncio.create_task(self._flush_watchlists())
         
-        # Send startup message
+        # Announce startup without holding up polling; reuses the application's pooled HTTP client
         if self.chat_id:
-            try:
-                startup_msg = """
-🚀 **Interactive Trading Bot Started!**
-
-Ready to analyze crypto & stocks with AI-powered insights!
+            task = asyncio.create_task(application.bot.send_message(
+                chat_id=self.chat_id,
+                text=STARTUP_MESSAGE,
+                parse_mode='Markdown'
+            ))
+            task.add_done_callback(self._log_startup_message_failure)
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+    
+    async def _post_shutdown(self, application: Application):
+        """Stop the watchlist flusher and write out any change it has not flushed yet"""
+        if self._watchlists_flusher is not None:
+            self._watchlists_flusher.cancel()
+            self._watchlists_flusher = None
+        # A write the flusher had in flight when it was cancelled keeps running; let it finish
+        if self._watchlists_write is not None:
+            await self._watchlists_write
+            self._watchlists_write = None
+        if self._watchlists_dirty.is_set():
+            self._watchlists_dirty.clear()
+            await self._persist_watchlists()
+    
+    @staticmethod
+    def _log_startup_message_failure(task: asyncio.Task):
+        """Log a failed startup message send (nothing else waits on it)"""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Could not send startup message: %s", task.exception())
+    
+    def run(self):
+        """Run the interactive bot (blocks until stopped with Ctrl+C or SIGTERM)"""
+        logger.info("Starting Interactive Trading Bot...")
+        if self.webhook_url:
+            # Telegram pushes updates to us instead of the bot holding a long-polling request open;
+            # the token as URL path keeps the endpoint unguessable
+            port = int(os.getenv('PORT', WEBHOOK_PORT))
+            logger.info("Receiving updates via webhook on port %s", port)
+            self.application.run_webhook(
+                listen=WEBHOOK_LISTEN,
+                port=port,
+                url_path=self.bot_token,
+                webhook_url=f"{self.webhook_url.rstrip('/')}/{self.bot_token}",
+                drop_pending_updates=True
+            )
+        else:
+            self.application.run_polling(drop_pending_updates=True)
+        logger.info("Bot stopped")
 
-Type `/help` to see all commands or just send a symbol like `BTC` for quick analysis.
-                """
-                await Bot(self.bot_token).send_message(
-                    chat_id=self.chat_id,
-                    text=startup_msg,
-                    parse_mode='Markdown'
-                )
-            except Exception as e:
-                logger.error(f"Could not send startup message: {e}")
-        
-        # Start the bot
-        await self.application.initialize()
-        await self.application.start()
-        await self.application.updater.start_polling(drop_pending_updates=True)
-        
-        try:
-            # Keep running
-            await asyncio.Event().wait()
-        except KeyboardInterrupt:
-            logger.info("Bot stopped by user")
-        finally:
-            await self.application.stop()
-
-async def main():
+def main():
     """Main function"""
     try:
         bot = InteractiveTradingBot()
-        await bot.run()
+        bot.run()
     except Exception as e:
-        logger.error(f"Error running bot: {e}")
+        logger.error("Error running bot: %s", e)
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    main()
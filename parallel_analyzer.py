@@ -0,0 +1,175 @@
+"""
+Parallel Analyzer for Indonesian Stock Trading Bot
+Runs analyze_stock over many symbols concurrently while staying within OpenAI rate limits
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from trading_bot import IndonesianStockBot, CHATGPT_DISABLED_RESULT, CHATGPT_SKIPPED_RESULT
+
+logger = logging.getLogger(__name__)
+
+# OpenAI budget shared by all analyses (a fraction of typical tier limits, leaving room for the live bot)
+DEFAULT_MAX_REQUESTS_PER_MINUTE = 60
+DEFAULT_MAX_TOKENS_PER_MINUTE = 150_000
+
+# Tokens charged for each analysis that calls ChatGPT: the prompt plus the reply budget (max_tokens=2000)
+TOKENS_PER_ANALYSIS = 4_000
+
+# Analyses in flight at once, attempts per symbol and the first retry delay in seconds (doubled per retry)
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 2.0
+
+# Seconds every new analysis waits after a rate-limit error, so the budget can recover
+RATE_LIMIT_COOLDOWN = 15.0
+
+# Stand-in confirmations analyze_stock uses when it makes no ChatGPT call (which costs no budget)
+CHATGPT_STAND_IN_ANALYSES = frozenset({CHATGPT_DISABLED_RESULT['analysis'], CHATGPT_SKIPPED_RESULT['analysis']})
+
+
+class RateBudget:
+    """Leaky-bucket request and token budgets that refill continuously up to their per-minute limits"""
+
+    def __init__(self, max_requests_per_minute: float, max_tokens_per_minute: float):
+        self.max_requests = max_requests_per_minute
+        self.max_tokens = max_tokens_per_minute
+        self.available_requests = max_requests_per_minute
+        self.available_tokens = max_tokens_per_minute
+        self._last_refill = time.monotonic()
+
+    def _refill(self):
+        """Add the capacity recovered since the last refill"""
+        now = time.monotonic()
+        elapsed_minutes = (now - self._last_refill) / 60
+        self._last_refill = now
+        self.available_requests = min(self.max_requests, self.available_requests + elapsed_minutes * self.max_requests)
+        self.available_tokens = min(self.max_tokens, self.available_tokens + elapsed_minutes * self.max_tokens)
+
+    def seconds_until_available(self, tokens: float) -> float:
+        """Seconds until one request costing the given tokens fits the budget (0 if it fits now)"""
+        self._refill()
+        tokens = min(tokens, self.max_tokens)
+        missing_requests = max(0.0, 1 - self.available_requests)
+        missing_tokens = max(0.0, tokens - self.available_tokens)
+        return 60 * max(missing_requests / self.max_requests, missing_tokens / self.max_tokens)
+
+    def consume(self, tokens: float):
+        """Charge one request and its tokens against the budget"""
+        self.available_requests -= 1
+        self.available_tokens -= tokens
+
+
+class ChatGPTRateLimited(Exception):
+    """Raised for a symbol whose ChatGPT confirmation was still rate-limited after every attempt"""
+
+
+class ParallelAnalyzer:
+    """Analyze many symbols concurrently, throttled by request/token budgets and retried with backoff"""
+
+    def __init__(self, bot: Optional[IndonesianStockBot] = None,
+                 max_requests_per_minute: float = DEFAULT_MAX_REQUESTS_PER_MINUTE,
+                 max_tokens_per_minute: float = DEFAULT_MAX_TOKENS_PER_MINUTE,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                 gate_chatgpt: bool = True,
+                 send_signals: bool = False):
+        self.bot = bot or IndonesianStockBot()
+        self.budget = RateBudget(max_requests_per_minute, max_tokens_per_minute)
+        self.max_concurrency = max_concurrency
+        self.max_attempts = max_attempts
+        self.gate_chatgpt = gate_chatgpt
+        self.send_signals = send_signals  # Off by default so bulk runs stay out of the Telegram chat
+        self._cooldown_until = 0.0
+
+    @staticmethod
+    def _chatgpt_confirmation(signal_info: Optional[Dict]) -> Optional[Dict]:
+        """The ChatGPT response an analysis actually requested (None if it made no ChatGPT call)"""
+        confirmation = signal_info.get('chatgpt_confirmation') if signal_info else None
+        if confirmation is None or confirmation['analysis'] in CHATGPT_STAND_IN_ANALYSES:
+            return None
+        return confirmation
+
+    async def _acquire(self):
+        """Wait for any rate-limit cooldown and until the budget has room for one more ChatGPT call.
+        The call is only charged once the analysis shows it was made, so overshoot is bounded by max_concurrency"""
+        while True:
+            delay = max(self._cooldown_until - time.monotonic(), self.budget.seconds_until_available(TOKENS_PER_ANALYSIS))
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def _finish(self, symbol: str, signal_info: Optional[Dict]) -> Optional[Dict]:
+        """Record the returned attempt in the watchlist history, once per symbol however many attempts it took.
+        Dry runs (send_signals False) leave the watchlist alone"""
+        if self.send_signals and signal_info and 'chatgpt_confirmation' in signal_info:
+            self.bot.update_watchlist_data(symbol, signal_info)
+        return signal_info
+
+    async def _analyze_with_retries(self, symbol: str, data) -> Optional[Dict]:
+        """Analyze one symbol, retrying failed or rate-limited attempts with exponential backoff"""
+        for attempt in range(1, self.max_attempts + 1):
+            await self._acquire()
+            try:
+                signal_info = await self.bot.analyze_stock(symbol, data=data, gate_chatgpt=self.gate_chatgpt,
+                                                           send_signals=self.send_signals, track_watchlist=False)
+            except Exception as e:
+                if attempt == self.max_attempts:
+                    raise
+                delay = RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                logger.warning(f"Analysis of {symbol} failed (attempt {attempt}/{self.max_attempts}), retrying in {delay:.0f}s: {e}")
+                await asyncio.sleep(delay)
+                continue
+
+            confirmation = self._chatgpt_confirmation(signal_info)
+            if confirmation is None:
+                return self._finish(symbol, signal_info)
+            self.budget.consume(TOKENS_PER_ANALYSIS)
+            if not confirmation.get('rate_limited'):
+                return self._finish(symbol, signal_info)
+
+            # get_chatgpt_confirmation answers a 429 with a fallback; back off before the next ChatGPT call
+            self._cooldown_until = time.monotonic() + RATE_LIMIT_COOLDOWN
+            if self.send_signals and not signal_info.get('chatgpt_filtered'):
+                # The signal already went out with its fallback confirmation; another attempt would send it again.
+                # A fallback below the confidence threshold was filtered instead, sent nothing, and is retried
+                logger.warning(f"ChatGPT rate limit hit for {symbol}; its signal was sent without a confirmation")
+                return self._finish(symbol, signal_info)
+            if attempt == self.max_attempts:
+                raise ChatGPTRateLimited(f"ChatGPT rate limit hit on all {self.max_attempts} attempts")
+            delay = RETRY_BASE_DELAY * 2 ** (attempt - 1)
+            logger.warning(f"ChatGPT rate limit hit for {symbol} (attempt {attempt}/{self.max_attempts}), retrying in {delay:.0f}s")
+            await asyncio.sleep(delay)
+
+    async def analyze(self, symbols: List[str]) -> Dict[str, object]:
+        """Analyze all symbols; each maps to its signal info, None, or the exception of its last attempt"""
+        # One batched download for every symbol; anything it misses is fetched per symbol by analyze_stock
+        prefetched = await self.bot.run_blocking(self.bot.fetch_stocks_data, symbols)
+
+        # A fixed pool of workers drains a queue, so only max_concurrency tasks exist however many symbols there are
+        queue = asyncio.Queue()
+        for symbol in symbols:
+            queue.put_nowait(symbol)
+        results = {}
+
+        async def worker():
+            while True:
+                symbol = await queue.get()
+                try:
+                    results[symbol] = await self._analyze_with_retries(symbol, prefetched.get(symbol))
+                except Exception as e:
+                    results[symbol] = e
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.max_concurrency, len(symbols)))]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        return {symbol: results[symbol] for symbol in symbols}
@@ -5,17 +5,29 @@ Optimized for server deployment with enhanced error handling and monitoring
 """
 
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
 import signal
 import sys
 import os
+import random
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-import schedule
 import traceback
 from trading_bot import IndonesianStockBot
 
+# Notifications queued within this window are sent as one Telegram message
+NOTIFICATION_FLUSH_INTERVAL = 2.0  # seconds
+NOTIFICATION_BATCH_SIZE = 10
+NOTIFICATION_SEPARATOR = "\n---\n"
+TELEGRAM_MESSAGE_LIMIT = 4096
+
+# INFO records are written to the log file in batches of this many (ERROR and above flush immediately)
+LOG_BUFFER_CAPACITY = 100
+
 # Setup production logging
 def setup_production_logging():
     """Setup comprehensive logging for production environment"""
@@ -40,9 +52,10 @@ def setup_production_logging():
     error_handler = logging.FileHandler('logs/trading_bot_errors.log')
     error_handler.setLevel(logging.ERROR)
     
-    # Console handler for immediate feedback
+    # Console handler for immediate feedback; without a terminal (systemd) stdout only feeds the
+    # journal, so it carries warnings and errors while the full INFO log stays in logs/
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
+    console_handler.setLevel(logging.INFO if sys.stdout.isatty() else logging.WARNING)
     
     # Create formatter
     formatter = logging.Formatter(
@@ -55,10 +68,22 @@ def setup_production_logging():
     error_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
+    # Buffer the general log so INFO lines are written in batches; an ERROR flushes the buffer straight away
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+    )
+    
+    # File and console writes happen on a listener thread; callers only enqueue the record
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, buffered_file_handler, error_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Registered after logging's own shutdown hook, so the queue is drained before the buffer is flushed
+    atexit.register(listener.stop)
+    
     # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(error_handler)
-    logger.addHandler(console_handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     return logger
 
@@ -71,8 +96,12 @@ class ProductionTradingBot:
         self.running = False
         self.last_successful_run = None
         self.error_count = 0
-        self.max_errors = 5
-        self.restart_delay = 300  # 5 minutes
+        self.max_errors = 5  # Consecutive failed daily runs before the bot stops
+        self.max_attempts = 3  # Attempts per daily run before waiting for the next scheduled run
+        self.retry_base_delay = 60  # seconds; doubled for every further attempt
+        self.max_retry_delay = 600  # 10 minutes
+        self._notification_queue = None  # Created by run_production together with its flusher
+        self._stop_event = None  # Created by run_production; set by stop() to wake sleeping jobs
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self.signal_handler)
@@ -111,41 +140,124 @@ class ProductionTradingBot:
             return False
     
     async def run_daily_analysis_safe(self):
-        """Run daily analysis with comprehensive error handling"""
-        try:
-            self.logger.info("🔍 Starting daily analysis...")
-            start_time = datetime.now()
-            
-            if not self.bot:
-                if not await self.initialize_bot():
-                    raise Exception("Bot initialization failed")
-            
-            # Run the analysis
-            await self.bot.run_daily_analysis()
-            
-            # Record successful run
-            self.last_successful_run = datetime.now()
-            self.error_count = 0  # Reset error count on success
-            
-            duration = (datetime.now() - start_time).total_seconds()
-            self.logger.info(f"✅ Daily analysis completed successfully in {duration:.1f} seconds")
-            
-            # Send health check message
-            await self.send_health_check()
-            
-        except Exception as e:
-            self.error_count += 1
-            self.logger.error(f"❌ Daily analysis failed (error {self.error_count}/{self.max_errors}): {e}")
-            self.logger.error(traceback.format_exc())
+        """Run daily analysis with comprehensive error handling, retrying failed attempts with backoff.
+        Only a daily run whose attempts all fail counts toward max_errors; returns whether the run succeeded"""
+        for attempt in range(1, self.max_attempts + 1):
+            last_sent_signal = self._last_sent_signal()
+            try:
+                self.logger.info("🔍 Starting daily analysis...")
+                start_time = datetime.now()
+                
+                if not self.bot:
+                    if not await self.initialize_bot():
+                        raise Exception("Bot initialization failed")
+                
+                # Run the analysis
+                await self.bot.run_daily_analysis()
+                
+                # Record successful run
+                self.last_successful_run = datetime.now()
+                self.error_count = 0  # Reset error count on success
+                
+                duration = (datetime.now() - start_time).total_seconds()
+                self.logger.info(f"✅ Daily analysis completed successfully in {duration:.1f} seconds")
+                
+                # Send health check message
+                await self.send_health_check()
+                return True
+                
+            except Exception as e:
+                error = e
+                self.logger.error(f"❌ Daily analysis attempt {attempt}/{self.max_attempts} failed: {e}")
+                self.logger.error(traceback.format_exc())
             
-            # Send error notification
-            await self.send_error_notification(e)
+            # A retry re-runs the whole analysis, so it would send this attempt's signals a second time
+            if self._last_sent_signal() is not last_sent_signal:
+                self.logger.warning("⚠️ Signals were already sent during the failed attempt, not retrying")
+                break
+            if attempt < self.max_attempts:
+                delay = self.retry_delay(attempt)
+                self.logger.info(f"🔄 Retrying daily analysis in {delay:.0f} seconds")
+                if not await self._sleep_while_running(delay):
+                    break
+        
+        self.error_count += 1
+        self.logger.error(f"❌ Daily analysis failed (error {self.error_count}/{self.max_errors})")
+        
+        # Send error notification
+        await self.send_error_notification(error)
+        
+        # Check if we've exceeded max errors
+        if self.error_count >= self.max_errors:
+            self.logger.critical(f"🚨 Maximum error count ({self.max_errors}) reached. Stopping bot.")
+            await self.send_critical_error_notification()
+            self.stop()
+        return False
+    
+    def _last_sent_signal(self):
+        """The newest entry in the bot's sent-signal history (None before the first signal)"""
+        if self.bot and self.bot.signals_history:
+            return self.bot.signals_history[-1]
+        return None
+    
+    async def notify(self, message: str):
+        """Queue a notification for the batching flusher, or send it directly when no flusher is running"""
+        if self._notification_queue is not None:
+            self._notification_queue.put_nowait(message)
+        else:
+            await self.bot.send_telegram_message(message)
+    
+    async def _send_notification_batch(self, messages):
+        """Send queued notifications joined into as few Telegram messages as the length limit allows"""
+        batch = []
+        batch_length = 0
+        for message in messages:
+            added_length = len(message) + (len(NOTIFICATION_SEPARATOR) if batch else 0)
+            if batch and batch_length + added_length > TELEGRAM_MESSAGE_LIMIT:
+                await self.bot.send_telegram_message(NOTIFICATION_SEPARATOR.join(batch))
+                batch = []
+                added_length = len(message)
+                batch_length = 0
+            batch.append(message)
+            batch_length += added_length
+        if batch:
+            await self.bot.send_telegram_message(NOTIFICATION_SEPARATOR.join(batch))
+    
+    async def _notification_flusher(self):
+        """Collect queued notifications for a short window and send them together"""
+        pending = self._notification_queue
+        loop = asyncio.get_running_loop()
+        while True:
+            messages = [await pending.get()]
+            deadline = loop.time() + NOTIFICATION_FLUSH_INTERVAL
+            while len(messages) < NOTIFICATION_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    messages.append(await asyncio.wait_for(pending.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
             
-            # Check if we've exceeded max errors
-            if self.error_count >= self.max_errors:
-                self.logger.critical(f"🚨 Maximum error count ({self.max_errors}) reached. Stopping bot.")
-                await self.send_critical_error_notification()
-                self.running = False
+            try:
+                await self._send_notification_batch(messages)
+            except Exception as e:
+                self.logger.error(f"❌ Failed to send queued notifications: {e}")
+    
+    async def _drain_notifications(self, flusher):
+        """Stop the flusher and send anything still queued"""
+        flusher.cancel()
+        pending = self._notification_queue
+        self._notification_queue = None
+        
+        messages = []
+        while not pending.empty():
+            messages.append(pending.get_nowait())
+        if messages:
+            try:
+                await self._send_notification_batch(messages)
+            except Exception as e:
+                self.logger.error(f"❌ Failed to send queued notifications: {e}")
     
     async def send_health_check(self):
         """Send periodic health check message"""
@@ -167,7 +279,7 @@ class ProductionTradingBot:
 🇮🇩 Indonesian Stock Bot - Production Mode
                     """
                     
-                    await self.bot.send_telegram_message(health_message.strip())
+                    await self.notify(health_message.strip())
                     
         except Exception as e:
             self.logger.warning(f"⚠️ Failed to send health check: {e}")
@@ -188,7 +300,7 @@ class ProductionTradingBot:
 ⚠️ If errors persist, manual intervention may be required
                 """
                 
-                await self.bot.send_telegram_message(error_message.strip())
+                await self.notify(error_message.strip())
                 
         except Exception as e:
             self.logger.error(f"❌ Failed to send error notification: {e}")
@@ -215,37 +327,81 @@ class ProductionTradingBot:
 • Check status: sudo systemctl status trading-bot
                 """
                 
-                await self.bot.send_telegram_message(critical_message.strip())
+                await self.notify(critical_message.strip())
                 
         except Exception as e:
             self.logger.error(f"❌ Failed to send critical error notification: {e}")
     
+    def stop(self):
+        """Stop the production loop, waking scheduled jobs that are sleeping until their next run"""
+        self.running = False
+        if self._stop_event is not None:
+            self._stop_event.set()
+    
+    async def _sleep_while_running(self, seconds: float) -> bool:
+        """Sleep for the given time or until stop() is called; returns whether the bot is still running"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+        return self.running
+    
+    def retry_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter after the given failed attempt, capped at max_retry_delay"""
+        delay = min(self.max_retry_delay, self.retry_base_delay * 2 ** (attempt - 1))
+        return delay + random.uniform(0, delay * 0.1)
+    
+    async def _run_daily_at(self, hour: int, minute: int, job):
+        """Run a job every day at the given local time, sleeping until each run instead of polling"""
+        while self.running:
+            now = datetime.now()
+            next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if next_run <= now:
+                next_run += timedelta(days=1)
+            
+            if not await self._sleep_while_running((next_run - now).total_seconds()):
+                break
+            
+            try:
+                await job()
+            except Exception as e:
+                self.logger.error(f"❌ Error in scheduled job {job.__name__}: {e}")
+                self.logger.error(traceback.format_exc())
+    
     def schedule_daily_analysis(self):
         """Schedule daily analysis at market close time"""
-        # Schedule for 5:00 PM Jakarta time (after market close)
-        schedule.every().day.at("17:00").do(
-            lambda: asyncio.create_task(self.run_daily_analysis_safe())
-        )
-        
-        # Also schedule a health check at 8:00 AM
-        schedule.every().day.at("08:00").do(
-            lambda: asyncio.create_task(self.send_health_check())
-        )
+        jobs = [
+            # Daily analysis at 5:00 PM Jakarta time (after market close)
+            asyncio.create_task(self._run_daily_at(17, 0, self.run_daily_analysis_safe)),
+            # Also a health check at 8:00 AM
+            asyncio.create_task(self._run_daily_at(8, 0, self.send_health_check)),
+        ]
         
         self.logger.info("📅 Scheduled daily analysis at 17:00 Jakarta time")
         self.logger.info("📅 Scheduled health check at 08:00 Jakarta time")
+        return jobs
     
     async def run_production(self):
         """Main production loop"""
         self.running = True
+        self._stop_event = asyncio.Event()
+        
+        # Run new tasks eagerly up to their first suspension point (Python 3.12+)
+        eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+        if eager_task_factory is not None:
+            asyncio.get_running_loop().set_task_factory(eager_task_factory)
         
         # Initialize bot
         if not await self.initialize_bot():
             self.logger.critical("🚨 Failed to initialize bot, exiting...")
             return
         
+        # Batch health and error notifications into as few Telegram sends as possible
+        self._notification_queue = asyncio.Queue()
+        flusher = asyncio.create_task(self._notification_flusher())
+        
         # Schedule tasks
-        self.schedule_daily_analysis()
+        jobs = self.schedule_daily_analysis()
         
         # Send startup notification
         try:
@@ -269,24 +425,13 @@ class ProductionTradingBot:
         # Main loop
         self.logger.info("🔄 Entering main production loop...")
         
-        while self.running:
-            try:
-                # Run scheduled tasks
-                schedule.run_pending()
-                
-                # Sleep for 1 minute before checking again
-                await asyncio.sleep(60)
-                
-            except KeyboardInterrupt:
-                self.logger.info("📡 Received keyboard interrupt, shutting down...")
-                break
-                
-            except Exception as e:
-                self.logger.error(f"❌ Error in main loop: {e}")
-                self.logger.error(traceback.format_exc())
-                
-                # Wait before retrying
-                await asyncio.sleep(self.restart_delay)
+        try:
+            # Each job sleeps until its next run; a job only returns once the bot stops running
+            await asyncio.wait(jobs, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for job in jobs:
+                job.cancel()
+            await self._drain_notifications(flusher)
         
         self.logger.info("🛑 Production loop ended")
     
@@ -3,7 +3,6 @@
 Startup script for Interactive Telegram Trading Bot
 """
 
-import asyncio
 import sys
 from interactive_telegram_bot import InteractiveTradingBot
 
@@ -25,7 +24,7 @@ def main():
     
     try:
         # Run the interactive bot
-        asyncio.run(InteractiveTradingBot().run())
+        InteractiveTradingBot().run()
     except KeyboardInterrupt:
         print("\n🛑 Bot stopped by user")
     except Exception as e:
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test script for analyzing many stocks at once
+Runs the parallel analyzer over a symbol list within OpenAI rate limits
+Signals are not sent to Telegram unless --send is given
+"""
+
+import sys
+import time
+from collections import Counter
+from parallel_analyzer import ParallelAnalyzer
+from test_utils import get_bot, run_test
+from config import INDONESIAN_STOCKS, WATCHLIST_STOCKS
+
+
+async def test_bulk(symbols, send_signals: bool = False):
+    """Analyze all symbols in parallel and print a one-line result per symbol plus a summary"""
+    print(f"🧪 BULK TESTING {len(symbols)} SYMBOLS")
+    print(f"📨 Telegram: {'signals are sent' if send_signals else 'nothing is sent'}")
+    print("=" * 60)
+
+    start = time.monotonic()
+    results = await ParallelAnalyzer(get_bot(), send_signals=send_signals).analyze(symbols)
+    elapsed = time.monotonic() - start
+
+    signal_counts = Counter()
+    failed = 0
+    for symbol, result in results.items():
+        if isinstance(result, Exception):
+            failed += 1
+            print(f"❌ {symbol}: Error - {result}")
+        elif result:
+            signal_counts[result['signal']] += 1
+            rate_limited = result.get('chatgpt_confirmation', {}).get('rate_limited')
+            print(f"✅ {symbol}: {result['signal']} ({result['signal_reason']}) | "
+                  f"{result['current_price']:,} ({result['price_change']:+.2f}%) | RSI: {result['rsi']:.0f}"
+                  f"{' | ⚠️ ChatGPT rate-limited' if rate_limited else ''}")
+        else:
+            failed += 1
+            print(f"❌ {symbol}: No data")
+
+    print("\n" + "=" * 60)
+    print(f"📊 Analyzed: {len(symbols) - failed}/{len(symbols)} in {elapsed:.1f}s")
+    for signal, count in signal_counts.most_common():
+        print(f"   {signal}: {count}")
+
+
+def main():
+    """Run the bulk test on the watchlist (default), all Indonesian stocks, or the given symbols;
+    --send also sends valid signals to the Telegram chat"""
+    args = sys.argv[1:]
+    send_signals = "--send" in args
+    args = [arg for arg in args if arg != "--send"]
+    if not args or args == ["watchlist"]:
+        symbols = list(WATCHLIST_STOCKS)
+    elif args == ["all"]:
+        symbols = list(INDONESIAN_STOCKS)
+    else:
+        symbols = [symbol.upper() for symbol in args]
+
+    run_test(test_bulk(symbols, send_signals))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,9 @@ Test script for Enhanced ChatGPT Analysis with Vision Capabilities
 Demonstrates both statistical and visual chart analysis
 """
 
-import asyncio
 import sys
+import textwrap
+from test_utils import cached_analyze_stock, get_bot, run_test
 from trading_bot import IndonesianStockBot
 from config import (
     ENABLE_CHATGPT_CONFIRMATION, ENABLE_CHATGPT_VISION, 
@@ -12,6 +13,16 @@ from config import (
 )
 
 
+def print_wrapped(text: str):
+    """Print text word-wrapped to 80 columns behind a three-space indent"""
+    lines = textwrap.wrap(
+        ' '.join(text.split()), width=83, initial_indent='   ', subsequent_indent='   ',
+        break_long_words=False, break_on_hyphens=False
+    )
+    if lines:
+        print('\n'.join(lines))
+
+
 async def test_enhanced_chatgpt_analysis(symbol: str = "BBCA.JK"):
     """Test the enhanced ChatGPT analysis with both statistical and visual capabilities"""
     try:
@@ -25,7 +36,7 @@ async def test_enhanced_chatgpt_analysis(symbol: str = "BBCA.JK"):
         print(f"👁️ Vision Model: {CHATGPT_VISION_MODEL}")
         print("-" * 70)
         
-        bot = IndonesianStockBot()
+        bot = get_bot()
         
         # Check if OpenAI client is available
         if not bot.openai_client:
@@ -35,7 +46,8 @@ async def test_enhanced_chatgpt_analysis(symbol: str = "BBCA.JK"):
         
         # Analyze single stock
         print(f"\n🔍 Analyzing {symbol}...")
-        signal_info = await bot.analyze_stock(symbol)
+        # Always ask ChatGPT here, even for quiet HOLD signals - its analysis is what this script shows
+        signal_info = await cached_analyze_stock(symbol, gate_chatgpt=False)
         
         if signal_info:
             print(f"\n📊 BASIC SIGNAL INFORMATION")
@@ -69,21 +81,7 @@ async def test_enhanced_chatgpt_analysis(symbol: str = "BBCA.JK"):
                 print("-" * 30)
                 analysis_text = confirmation.get('analysis', 'No analysis available')
                 # Wrap long text
-                words = analysis_text.split()
-                lines = []
-                current_line = []
-                for word in words:
-                    if len(' '.join(current_line + [word])) <= 80:
-                        current_line.append(word)
-                    else:
-                        if current_line:
-                            lines.append(' '.join(current_line))
-                        current_line = [word]
-                if current_line:
-                    lines.append(' '.join(current_line))
-                
-                for line in lines:
-                    print(f"   {line}")
+                print_wrapped(analysis_text)
                 
                 # Key factors
                 print(f"\n🔑 **KEY FACTORS**")
@@ -125,13 +123,7 @@ async def test_enhanced_chatgpt_analysis(symbol: str = "BBCA.JK"):
                     print(f"\n📊 **SENTIMENT ANALYSIS**")
                     print("-" * 25)
                     
-                    sentiment_emoji = {
-                        'VERY_POSITIVE': "🚀",
-                        'POSITIVE': "📈",
-                        'NEUTRAL': "➡️",
-                        'NEGATIVE': "📉",
-                        'VERY_NEGATIVE': "💥"
-                    }.get(sentiment.get('overall_sentiment', 'NEUTRAL'), "❓")
+                    sentiment_emoji = IndonesianStockBot.SENTIMENT_EMOJI.get(sentiment.get('overall_sentiment', 'NEUTRAL'), "❓")
                     
                     print(f"   {sentiment_emoji} Overall: {sentiment.get('overall_sentiment', 'NEUTRAL')}")
                     print(f"   📊 Score: {sentiment.get('sentiment_score', 0.5):.1%}")
@@ -155,21 +147,7 @@ async def test_enhanced_chatgpt_analysis(symbol: str = "BBCA.JK"):
                     print(f"\n📝 **ADDITIONAL INSIGHTS**")
                     print("-" * 25)
                     # Wrap additional notes
-                    words = additional_notes.split()
-                    lines = []
-                    current_line = []
-                    for word in words:
-                        if len(' '.join(current_line + [word])) <= 80:
-                            current_line.append(word)
-                        else:
-                            if current_line:
-                                lines.append(' '.join(current_line))
-                            current_line = [word]
-                    if current_line:
-                        lines.append(' '.join(current_line))
-                    
-                    for line in lines:
-                        print(f"   {line}")
+                    print_wrapped(additional_notes)
                 
                 # Signal status
                 if signal_info.get('chatgpt_filtered', False):
@@ -212,7 +190,7 @@ def main():
     print("This will demonstrate both statistical and visual analysis capabilities")
     print()
     
-    asyncio.run(test_enhanced_chatgpt_analysis(symbol))
+    run_test(test_enhanced_chatgpt_analysis(symbol))
 
 
 if __name__ == "__main__":
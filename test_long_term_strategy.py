@@ -5,8 +5,11 @@ Shows how ANTM.JK would be analyzed with the new configuration
 """
 
 import sys
-import asyncio
-from trading_bot import IndonesianStockBot
+from test_utils import cached_analyze_stock, run_test
+
+# Crypto base symbols recognised by this script; short forms are expanded to their Yahoo Finance -USD pair
+CRYPTO_TOKENS = frozenset({'BTC', 'ETH', 'BNB', 'ADA', 'SOL', 'DOGE', 'XRP', 'DOT', 'AVAX', 'MATIC'})
+CRYPTO_PAIRS = {token: f'{token}-USD' for token in CRYPTO_TOKENS}
 
 async def test_long_term_strategy(symbol="ANTM.JK"):
     """Test the long-term strategy on any symbol (stocks or crypto)"""
@@ -14,17 +17,14 @@ async def test_long_term_strategy(symbol="ANTM.JK"):
     print("=" * 50)
     
     # Determine if it's crypto or stock
-    is_crypto = any(crypto in symbol.upper() for crypto in ['BTC', 'ETH', 'BNB', 'ADA', 'SOL', 'DOGE', 'XRP', 'DOT', 'AVAX', 'MATIC'])
+    is_crypto = symbol.upper().partition('-')[0] in CRYPTO_TOKENS
     asset_type = "Cryptocurrency" if is_crypto else "Indonesian Stock"
     
     try:
-        # Initialize the bot
-        bot = IndonesianStockBot()
-        
         print(f"📊 Analyzing {symbol} ({asset_type}) with long-term parameters...")
         
         # Fetch and analyze the asset
-        signal_info = await bot.analyze_stock(symbol)
+        signal_info = await cached_analyze_stock(symbol)
         
         if signal_info:
             print(f"\n✅ Analysis Complete for {symbol}")
@@ -93,22 +93,10 @@ if __name__ == "__main__":
         symbol = sys.argv[1].upper()
         
         # Auto-format common crypto symbols
-        crypto_pairs = {
-            'BTC': 'BTC-USD',
-            'ETH': 'ETH-USD', 
-            'BNB': 'BNB-USD',
-            'ADA': 'ADA-USD',
-            'SOL': 'SOL-USD',
-            'DOGE': 'DOGE-USD',
-            'XRP': 'XRP-USD',
-            'DOT': 'DOT-USD',
-            'AVAX': 'AVAX-USD',
-            'MATIC': 'MATIC-USD'
-        }
-        
-        if symbol in crypto_pairs:
-            symbol = crypto_pairs[symbol]
-        elif not symbol.endswith('.JK') and not symbol.endswith('-USD'):
+        crypto_pair = CRYPTO_PAIRS.get(symbol)
+        if crypto_pair:
+            symbol = crypto_pair
+        elif not symbol.endswith(('.JK', '-USD')):
             # If it's not crypto and not .JK, assume Indonesian stock
             symbol += '.JK'
             
@@ -121,4 +109,4 @@ if __name__ == "__main__":
         print(f"   Crypto (short): python test_long_term_strategy.py BTC")
     
     # Run the test
-    asyncio.run(test_long_term_strategy(symbol)) 
\ No newline at end of file
+    run_test(test_long_term_strategy(symbol)) 
\ No newline at end of file
@@ -0,0 +1,62 @@
+"""
+Shared helpers for the test scripts
+"""
+
+import asyncio
+import hashlib
+import pickle
+import time
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+from trading_bot import IndonesianStockBot
+from config import CHATGPT_MODEL, ENABLE_CHATGPT_VISION
+
+# Analyses are reused from disk for repeated runs on the same symbol within this many seconds
+ANALYSIS_CACHE_DIR = Path(".cache/analysis")
+ANALYSIS_CACHE_TTL = 3600
+
+
+@lru_cache(maxsize=1)
+def get_bot() -> IndonesianStockBot:
+    """Return one shared bot so repeated analyses reuse its OpenAI/Telegram clients and data caches"""
+    return IndonesianStockBot()
+
+
+def _analysis_cache_path(symbol: str, gate_chatgpt: bool) -> Path:
+    """Cache file for a symbol's analysis today under the current ChatGPT settings"""
+    key = hashlib.sha256(f"{symbol}|{date.today()}|{CHATGPT_MODEL}|{ENABLE_CHATGPT_VISION}|{gate_chatgpt}".encode()).hexdigest()
+    return ANALYSIS_CACHE_DIR / f"{key}.pkl"
+
+
+async def cached_analyze_stock(symbol: str, gate_chatgpt: bool = True) -> Optional[Dict]:
+    """Analyze a stock with the shared bot, reusing a result saved to disk by a recent run.
+    Low-value HOLD signals skip ChatGPT unless gate_chatgpt is False"""
+    path = _analysis_cache_path(symbol, gate_chatgpt)
+    try:
+        if time.time() - path.stat().st_mtime < ANALYSIS_CACHE_TTL:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    
+    signal_info = await get_bot().analyze_stock(symbol, gate_chatgpt=gate_chatgpt)
+    if signal_info:
+        # Written to a temporary file first so a concurrent reader never sees a partial pickle
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(signal_info, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+    return signal_info
+
+
+def run_test(coro):
+    """Run a test coroutine to completion on a new event loop that starts tasks eagerly (Python 3.12+)"""
+    with asyncio.Runner() as runner:
+        eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+        if eager_task_factory is not None:
+            runner.get_loop().set_task_factory(eager_task_factory)
+        return runner.run(coro)
@@ -2,6 +2,7 @@
 Simple test script to diagnose Yahoo Finance connectivity issues
 """
 
+import asyncio
 import yfinance as yf
 import pandas as pd
 import requests
@@ -55,17 +56,25 @@ def test_yfinance_library():
         print(f"❌ yfinance test failed: {e}")
         return False
 
-def test_different_symbols():
+async def fetch_history(ticker, period):
+    """Fetch history in a worker thread so independent requests overlap; errors are returned, not raised"""
+    try:
+        return await asyncio.to_thread(ticker.history, period=period)
+    except Exception as e:
+        return e
+
+async def test_different_symbols():
     """Test different stock symbols"""
     print("\n🧪 TESTING DIFFERENT SYMBOLS")
     print("-" * 40)
     
     symbols = ["AAPL", "MSFT", "GOOGL", "^GSPC", "BBCA.JK"]
+    results = await asyncio.gather(*(fetch_history(yf.Ticker(symbol), "5d") for symbol in symbols))
     
-    for symbol in symbols:
+    for symbol, data in zip(symbols, results):
         try:
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period="5d")
+            if isinstance(data, Exception):
+                raise data
             if not data.empty:
                 print(f"✅ {symbol}: {len(data)} days, Latest: {data['Close'].iloc[-1]:.2f}")
             else:
@@ -73,17 +82,19 @@ def test_different_symbols():
         except Exception as e:
             print(f"❌ {symbol}: Error - {e}")
 
-def test_alternative_periods():
+async def test_alternative_periods():
     """Test different time periods"""
     print("\n🧪 TESTING DIFFERENT PERIODS")
     print("-" * 40)
     
     periods = ["1d", "5d", "1mo", "3mo"]
+    ticker = yf.Ticker("AAPL")
+    results = await asyncio.gather(*(fetch_history(ticker, period) for period in periods))
     
-    for period in periods:
+    for period, data in zip(periods, results):
         try:
-            ticker = yf.Ticker("AAPL")
-            data = ticker.history(period=period)
+            if isinstance(data, Exception):
+                raise data
             if not data.empty:
                 print(f"✅ Period {period}: {len(data)} days")
             else:
@@ -91,7 +102,7 @@ def test_alternative_periods():
         except Exception as e:
             print(f"❌ Period {period}: Error - {e}")
 
-def main():
+async def main():
     """Run all diagnostic tests"""
     print("🔍 YAHOO FINANCE DIAGNOSTIC TOOL")
     print("=" * 50)
@@ -119,11 +130,11 @@ def main():
     print()
     
     # Test 4: Different symbols
-    test_different_symbols()
+    await test_different_symbols()
     print()
     
     # Test 5: Different periods
-    test_alternative_periods()
+    await test_alternative_periods()
     print()
     
     # Summary
@@ -141,4 +152,4 @@ def main():
         print("• Use VPN if Yahoo Finance is blocked")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    asyncio.run(main()) 
\ No newline at end of file
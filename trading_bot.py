@@ -15,26 +15,30 @@ import os
 from dotenv import load_dotenv
 from telegram import Bot
 from telegram.error import TelegramError
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, deque
+from types import MappingProxyType
 import schedule
+import threading
 import time
 import random
-import json
+import orjson
 import base64
-from openai import AsyncOpenAI
+import hashlib
+from openai import AsyncOpenAI, RateLimitError
+import indicators
 
 # Import configuration
 from config import (
-    INDONESIAN_STOCKS, SMA_SHORT_PERIOD, SMA_LONG_PERIOD, DATA_PERIOD,
+    INDONESIAN_STOCKS, SMA_SHORT_PERIOD, SMA_LONG_PERIOD, DATA_PERIOD, DATA_CACHE_SECONDS,
     MIN_VOLUME_THRESHOLD, MIN_PRICE_CHANGE, SIGNAL_BUY, SIGNAL_SELL, SIGNAL_STRONG_SELL, SIGNAL_HOLD,
     STOP_LOSS_PERCENTAGE, TAKE_PROFIT_PERCENTAGE, RSI_OVERBOUGHT_THRESHOLD, RSI_OVERSOLD_THRESHOLD,
     RSI_PERIOD, BEARISH_DIVERGENCE_THRESHOLD, HIGH_VOLUME_SELL_MULTIPLIER,
     ENABLE_CHATGPT_CONFIRMATION, CHATGPT_MODEL, CHATGPT_CONFIDENCE_THRESHOLD, CHATGPT_MAX_RETRIES,
     ENABLE_SENTIMENT_ANALYSIS, SENTIMENT_WEIGHT,
     ENABLE_CHATGPT_VISION, CHATGPT_VISION_MODEL, ENABLE_CHART_PATTERN_ANALYSIS, 
-    ENABLE_TECHNICAL_INDICATOR_VALIDATION, CHART_IMAGE_QUALITY,
+    ENABLE_TECHNICAL_INDICATOR_VALIDATION, CHART_IMAGE_QUALITY, CHART_DPI, CHART_PNG_COMPRESS_LEVEL,
     ENABLE_WATCHLIST, WATCHLIST_STOCKS, WATCHLIST_ALERT_THRESHOLD, WATCHLIST_PRIORITY_MULTIPLIER,
     ENABLE_WATCHLIST_DAILY_SUMMARY, WATCHLIST_PRICE_ALERT_PERCENTAGE, ENABLE_WATCHLIST_VOLUME_ALERTS,
     ENABLE_HOLD_SIGNALS, HOLD_SIGNAL_CONFIDENCE_THRESHOLD, SEND_HOLD_SIGNALS_REGARDLESS_OF_CONFIDENCE
@@ -54,10 +58,247 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Volume panel bar styling (bar width is in days, matching Axes.bar's default on a date axis)
+VOLUME_BAR_WIDTH = 0.8
+VOLUME_ALERT_RGBA = (1.0, 0.0, 0.0, 0.6)
+VOLUME_NORMAL_RGBA = (0.5, 0.5, 0.5, 0.6)
+
+# Line series longer than this are downsampled before plotting (2x the 1400px chart width)
+CHART_MAX_LINE_POINTS = 2800
+
+# Price panel lines drawn as one LineCollection: (column, legend label, RGBA colour, linewidth)
+# Colours are white, orange and blue as RGBA, so defining them doesn't need matplotlib
+PRICE_LINE_SERIES = (
+    ('Close', 'Close Price', (1.0, 1.0, 1.0, 1.0), 2.0),
+    (f'SMA_{SMA_SHORT_PERIOD}', f'SMA {SMA_SHORT_PERIOD}', (1.0, 165 / 255, 0.0, 0.8), 1.5),
+    (f'SMA_{SMA_LONG_PERIOD}', f'SMA {SMA_LONG_PERIOD}', (0.0, 0.0, 1.0, 0.8), 1.5),
+)
+
+# Price panel signal markers: (signal, colour, marker, size, legend label)
+SIGNAL_MARKERS = (
+    (SIGNAL_BUY, 'green', '^', 100, 'Buy Signal'),
+    (SIGNAL_SELL, 'red', 'v', 100, 'Sell Signal'),
+    (SIGNAL_STRONG_SELL, 'darkred', 'v', 150, 'Strong Sell'),
+)
+
+# Rendered chart PNGs kept for identical (symbol, last bar, signal) requests (~3MB at 64 charts)
+CHART_CACHE_SIZE = 64
+
+# Telegram file_ids of already-uploaded chart PNGs, so a resent chart is not uploaded again
+CHART_FILE_ID_CACHE_SIZE = 64
+
+# Sent signals kept in memory by a long-running bot, and per-watchlist-stock alert/signal history
+SIGNALS_HISTORY_SIZE = 500
+WATCHLIST_HISTORY_SIZE = 10
+
+# Worker threads for blocking analysis work (yfinance fetches, indicator computation)
+ANALYSIS_THREAD_POOL_SIZE = 8
+
+# Signal DataFrames kept for repeated analyses of an unchanged price history
+SIGNALS_CACHE_SIZE = 64
+
+# Fewest daily bars that give both SMAs and RSI a value
+MIN_HISTORY_BARS = max(SMA_LONG_PERIOD, RSI_PERIOD)
+
+# History periods tried in order by fetch_stock_data. "30d"/"1mo" are left out: about 21 trading
+# days can never reach MIN_HISTORY_BARS, so those requests were always wasted
+FETCH_PERIODS = (DATA_PERIOD, "3mo")
+
+# Confirmation returned when ChatGPT is not configured
+CHATGPT_DISABLED_RESULT = {
+    'confirmed': True,
+    'confidence': 1.0,
+    'analysis': 'ChatGPT confirmation disabled',
+    'recommendation': 'Proceed with original signal'
+}
+
+# Stand-in confirmation for HOLD signals too quiet to be worth a ChatGPT call when gating is requested
+CHATGPT_GATE_VOLUME_RATIO = 1.2
+CHATGPT_SKIPPED_RESULT = {
+    'confirmed': True,
+    'confidence': 1.0,
+    'analysis': 'ChatGPT confirmation skipped for a low-volume HOLD signal',
+    'recommendation': 'Proceed with original signal',
+    'analysis_type': 'Skipped (rule-based gate)'
+}
+
+# Stocks analysed at the same time during the daily run
+DAILY_ANALYSIS_CONCURRENCY = 8
+
+# Minimum seconds between the daily run's individual Yahoo fetches (symbols the batched download missed)
+DAILY_FETCH_INTERVAL = 3.0
+
+# Numeric columns read from the last two rows by validate_signal, in unpacking order
+VALIDATION_COLUMNS = (
+    'Close', 'Volume', 'Volume_Ratio', f'SMA_{SMA_SHORT_PERIOD}', f'SMA_{SMA_LONG_PERIOD}',
+    'RSI', 'Recent_High', 'Recent_Low',
+)
+
+# Consecutive Yahoo Finance errors before fetches fail fast, and the reopen backoff bounds (seconds)
+FETCH_FAILURE_THRESHOLD = 5
+FETCH_BREAKER_BASE_TIMEOUT = 0.5
+FETCH_BREAKER_MAX_TIMEOUT = 60.0
+
+# Chart style mutates global rcParams, so it is applied once per process rather than per chart.
+# matplotlib itself is imported by the chart code on first use, keeping it out of bot start-up
+_CHART_STYLE_APPLIED = False
+
+
+def _init_chart_style():
+    """Apply the dark chart style to the global rcParams (once)"""
+    global _CHART_STYLE_APPLIED
+    if not _CHART_STYLE_APPLIED:
+        import matplotlib.style as mplstyle
+        mplstyle.use('dark_background')
+        _CHART_STYLE_APPLIED = True
+
+
+def downsample_lttb(x: np.ndarray, y: np.ndarray, threshold: int = CHART_MAX_LINE_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+    """Downsample a line series with Largest-Triangle-Three-Buckets, dropping NaN warm-up values"""
+    finite = np.isfinite(y)
+    if not finite.all():
+        x, y = x[finite], y[finite]
+    
+    n = len(x)
+    if n <= threshold or threshold < 3:
+        return x, y
+    
+    # First and last points are always kept; the rest is split into threshold - 2 buckets
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+    keep = np.empty(threshold, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    
+    selected = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        # Pick the point forming the largest triangle with the previous pick and the next bucket's mean
+        area = np.abs((x[selected] - avg_x) * (y[start:end] - y[selected])
+                      - (x[selected] - x[start:end]) * (avg_y - y[selected]))
+        selected = start + int(np.argmax(area))
+        keep[i + 1] = selected
+    
+    return x[keep], y[keep]
+
+
+def to_float(value, default: float) -> float:
+    """Coerce a possibly non-numeric value (e.g. from a ChatGPT JSON reply) to float"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def format_number(value, spec: str, default: str = 'N/A') -> str:
+    """Format a value with a numeric format spec, falling back to a placeholder for non-numbers"""
+    try:
+        return format(float(value), spec)
+    except (TypeError, ValueError):
+        return default
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker so an outage fails fast instead of costing every symbol its retries"""
+    
+    CLOSED = 'CLOSED'
+    OPEN = 'OPEN'
+    HALF_OPEN = 'HALF_OPEN'
+    
+    def __init__(self, failure_threshold: int = FETCH_FAILURE_THRESHOLD,
+                 base_timeout: float = FETCH_BREAKER_BASE_TIMEOUT, max_timeout: float = FETCH_BREAKER_MAX_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.base_timeout = base_timeout
+        self.max_timeout = max_timeout
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.consecutive_opens = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()  # Fetches run in worker threads
+    
+    def reset_timeout(self) -> float:
+        """Seconds to stay open, doubling with each reopen that follows a failed trial"""
+        return min(self.max_timeout, self.base_timeout * 2 ** self.consecutive_opens)
+    
+    def allow_request(self) -> bool:
+        """Whether a call may go to the network; while half-open only a single trial call is let through"""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout():
+                    return False
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            if self.state == self.HALF_OPEN:
+                if self._trial_in_flight:
+                    return False
+                self._trial_in_flight = True
+            return True
+    
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failure_count = 0
+            self.consecutive_opens = 0
+            self._trial_in_flight = False
+    
+    def record_failure(self):
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                # The trial call failed: reopen with a longer timeout
+                self.consecutive_opens += 1
+                self._open()
+                return
+            self.failure_count += 1
+            if self.state == self.CLOSED and self.failure_count >= self.failure_threshold:
+                self._open()
+    
+    def _open(self):
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        self._trial_in_flight = False
+        logger.warning(f"Circuit opened after {self.failure_count} failures, retrying in {self.reset_timeout():.1f}s")
+
 
 class IndonesianStockBot:
     """Indonesian Stock Trading Bot with Enhanced SMA Crossover and Sell Signal Strategy"""
     
+    # Message emoji lookups, built once and read-only
+    SIGNAL_EMOJI = MappingProxyType({
+        SIGNAL_BUY: "🟢",
+        SIGNAL_SELL: "🔴",
+        SIGNAL_STRONG_SELL: "🚨",
+        SIGNAL_HOLD: "🟡"
+    })
+    STRENGTH_EMOJI = MappingProxyType({
+        'VERY_STRONG': "🚨🚨",
+        'STRONG': "💪",
+        'MODERATE': "👍",
+        'WEAK': "👎"
+    })
+    RECOMMENDATION_EMOJI = MappingProxyType({
+        'CONFIRM': "✅",
+        'REJECT': "❌",
+        'MODIFY': "⚠️",
+        'HOLD': "🟡",
+        'PROCEED_WITH_CAUTION': "⚠️"
+    })
+    RISK_EMOJI = MappingProxyType({
+        'LOW': "🟢",
+        'MEDIUM': "🟡",
+        'HIGH': "🔴",
+        'UNKNOWN': "❓"
+    })
+    SENTIMENT_EMOJI = MappingProxyType({
+        'VERY_POSITIVE': "🚀",
+        'POSITIVE': "📈",
+        'NEUTRAL': "➡️",
+        'NEGATIVE': "📉",
+        'VERY_NEGATIVE': "💥"
+    })
+    
     def __init__(self):
         self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
         self.chat_id = os.getenv('TELEGRAM_CHAT_ID')
@@ -79,16 +320,61 @@ class IndonesianStockBot:
             logger.warning("OPENAI_API_KEY not found in .env file. ChatGPT confirmation disabled.")
         
         self.telegram_bot = Bot(token=self.bot_token)
-        self.signals_history = []
+        self.signals_history = deque(maxlen=SIGNALS_HISTORY_SIZE)
         self.watchlist_data = {}  # Store watchlist stock data
         self.watchlist_alerts = []  # Store watchlist alerts
+        self._data_cache = {}  # symbol -> (cache window, price history DataFrame)
+        self._fetch_breaker = CircuitBreaker()  # Shared by single and batched Yahoo Finance fetches
+        self._tickers = {}  # symbol -> yf.Ticker, reused across retries and analysis runs
+        self._inflight_fetches = {}  # symbol -> future of the fetch currently running for it
+        self._signal_send_lock = asyncio.Lock()  # Held while one signal's chart and AI messages are sent
+        
+        # Chart figure is built once on first use and redrawn for every symbol
+        self._chart_figure = None
+        self._chart_axes = None
+        self._chart_lock = threading.Lock()
+        self._volume_date_formatter = None
+        self._volume_date_locator = None
+        self._chart_cache = OrderedDict()  # chart key -> PNG bytes, least recently used first
+        self._chart_file_ids = OrderedDict()  # PNG digest -> Telegram file_id, least recently used first
+        self._signals_cache = OrderedDict()  # (symbol, latest bar) -> signals DataFrame, least recently used first
+        # Charts render on a dedicated worker so Agg drawing never blocks the event loop
+        self._chart_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='chart-render')
+        # Bounded pool for fetches and signal generation, whichever entry point drives the bot
+        self._analysis_executor = ThreadPoolExecutor(max_workers=ANALYSIS_THREAD_POOL_SIZE, thread_name_prefix='analysis')
         
         logger.info("Indonesian Stock Trading Bot initialized with enhanced sell signals")
         if ENABLE_WATCHLIST:
             logger.info(f"Watchlist enabled with {len(WATCHLIST_STOCKS)} stocks: {', '.join(WATCHLIST_STOCKS)}")
     
+    def _get_cached_data(self, symbol: str) -> Optional[pd.DataFrame]:
+        """Return price history fetched for the symbol in the current cache window, if any"""
+        cached = self._data_cache.get(symbol)
+        if cached and cached[0] == int(time.time() // DATA_CACHE_SECONDS):
+            # Shallow copy: callers may add columns without touching the cached frame
+            return cached[1].copy(deep=False)
+        return None
+    
+    def _store_cached_data(self, symbol: str, data: pd.DataFrame):
+        """Cache fetched price history for the current window, dropping entries from older windows"""
+        window = int(time.time() // DATA_CACHE_SECONDS)
+        self._data_cache = {key: entry for key, entry in self._data_cache.items() if entry[0] == window}
+        self._data_cache[symbol] = (window, data)
+    
+    def _get_ticker(self, symbol: str) -> yf.Ticker:
+        """Return the cached yfinance Ticker for a symbol, creating it on first use"""
+        stock = self._tickers.get(symbol)
+        if stock is None:
+            stock = self._tickers[symbol] = yf.Ticker(symbol)
+        return stock
+    
     def fetch_stock_data(self, symbol: str) -> Optional[pd.DataFrame]:
         """Fetch stock data from Yahoo Finance with rate limiting and retry logic"""
+        cached = self._get_cached_data(symbol)
+        if cached is not None:
+            logger.info(f"Using cached data for {symbol} ({len(cached)} days)")
+            return cached
+        
         max_retries = 3
         base_delay = 2  # Base delay in seconds
         
@@ -100,26 +386,30 @@ class IndonesianStockBot:
                     logger.info(f"Retry {attempt + 1} for {symbol}, waiting {delay:.1f}s...")
                     time.sleep(delay)
                 
-                # Create ticker with session for better connection handling
-                stock = yf.Ticker(symbol)
-                
-                # Try different periods if 60d fails
-                periods_to_try = [DATA_PERIOD, "30d", "1mo", "3mo"]
+                # Reuse the ticker (and its HTTP session) instead of building a new one per attempt
+                stock = self._get_ticker(symbol)
                 
-                for period in periods_to_try:
+                # Try a shorter period if the configured one fails
+                for period in FETCH_PERIODS:
+                    if not self._fetch_breaker.allow_request():
+                        logger.warning(f"Yahoo Finance circuit open, skipping fetch for {symbol}")
+                        return None
                     try:
                         logger.info(f"Fetching {symbol} data for period: {period}")
                         data = stock.history(period=period)
+                        self._fetch_breaker.record_success()
                         
-                        if not data.empty and len(data) >= max(SMA_LONG_PERIOD, RSI_PERIOD):
+                        if not data.empty and len(data) >= MIN_HISTORY_BARS:
                             logger.info(f"Successfully fetched {len(data)} days of data for {symbol}")
+                            self._store_cached_data(symbol, data)
                             return data
                         elif not data.empty:
-                            logger.warning(f"Insufficient data for {symbol}: {len(data)} days (need {max(SMA_LONG_PERIOD, RSI_PERIOD)})")
+                            logger.warning(f"Insufficient data for {symbol}: {len(data)} days (need {MIN_HISTORY_BARS})")
                         else:
                             logger.warning(f"No data found for {symbol} with period {period}")
                             
                     except Exception as period_error:
+                        self._fetch_breaker.record_failure()
                         logger.warning(f"Failed to fetch {symbol} with period {period}: {period_error}")
                         continue
                 
@@ -152,56 +442,99 @@ class IndonesianStockBot:
         logger.error(f"Failed to fetch data for {symbol} after {max_retries} attempts")
         return None
     
+    def fetch_stocks_data(self, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+        """Fetch several symbols with a single batched Yahoo Finance download"""
+        frames = {}
+        for symbol in symbols:
+            cached = self._get_cached_data(symbol)
+            if cached is not None:
+                frames[symbol] = cached
+        symbols = [symbol for symbol in symbols if symbol not in frames]
+        if not symbols:
+            return frames
+        
+        if not self._fetch_breaker.allow_request():
+            logger.warning(f"Yahoo Finance circuit open, skipping batch fetch for {len(symbols)} symbols")
+            return frames
+        
+        try:
+            logger.info(f"Batch fetching {len(symbols)} symbols for period: {DATA_PERIOD}")
+            raw = yf.download(symbols, period=DATA_PERIOD, group_by='ticker', threads=True,
+                              auto_adjust=True, progress=False)
+            self._fetch_breaker.record_success()
+        except Exception as e:
+            self._fetch_breaker.record_failure()
+            logger.warning(f"Batch fetch failed for {', '.join(symbols)}: {e}")
+            return frames
+        
+        if raw is None or raw.empty:
+            return frames
+        
+        for symbol in symbols:
+            if isinstance(raw.columns, pd.MultiIndex):
+                if symbol not in raw.columns.get_level_values(0):
+                    continue
+                frame = raw[symbol]
+            elif len(symbols) == 1:
+                frame = raw
+            else:
+                continue
+            
+            # Symbols trade on different calendars; drop rows that only exist for other tickers
+            frame = frame.dropna(how='all')
+            if len(frame) >= MIN_HISTORY_BARS:
+                frames[symbol] = frame
+                self._store_cached_data(symbol, frame)
+            else:
+                logger.warning(f"Insufficient batched data for {symbol}: {len(frame)} days (need {MIN_HISTORY_BARS})")
+        
+        logger.info(f"Batch fetched {len(symbols)} symbols, {len(frames)} usable including cached")
+        return frames
+    
     def calculate_rsi(self, data: pd.DataFrame, period: int = RSI_PERIOD) -> pd.Series:
         """Calculate Relative Strength Index (RSI)"""
-        delta = data['Close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        return indicators.rsi(data['Close'], period)
     
     def calculate_technical_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
         """Calculate all technical indicators including SMAs and RSI"""
-        data = data.copy()
-        
-        # Simple Moving Averages
-        data[f'SMA_{SMA_SHORT_PERIOD}'] = data['Close'].rolling(window=SMA_SHORT_PERIOD).mean()
-        data[f'SMA_{SMA_LONG_PERIOD}'] = data['Close'].rolling(window=SMA_LONG_PERIOD).mean()
-        
-        # RSI
-        data['RSI'] = self.calculate_rsi(data)
-        
-        # Volume Moving Average for volume analysis
-        data['Volume_MA'] = data['Volume'].rolling(window=20).mean()
-        
-        # Price change percentage
-        data['Price_Change_Pct'] = data['Close'].pct_change() * 100
-        
-        # High and Low of recent periods for stop-loss/take-profit
-        data['Recent_High'] = data['High'].rolling(window=10).max()
-        data['Recent_Low'] = data['Low'].rolling(window=10).min()
-        
-        return data
+        close = data['Close']
+        # Both SMAs and RSI come from one pass over the close prices
+        sma_short, sma_long, rsi = indicators.close_indicators(close, SMA_SHORT_PERIOD, SMA_LONG_PERIOD, RSI_PERIOD)
+        volume_ma = indicators.sma(data['Volume'], 20)
+        
+        # A single assign builds the new frame once instead of copying and then inserting column by column
+        return data.assign(**{
+            # Simple Moving Averages
+            f'SMA_{SMA_SHORT_PERIOD}': sma_short,
+            f'SMA_{SMA_LONG_PERIOD}': sma_long,
+            # RSI
+            'RSI': rsi,
+            # Volume Moving Average for volume analysis
+            'Volume_MA': volume_ma,
+            # Volume relative to its average, shared by the signals, the summary and the chart
+            'Volume_Ratio': data['Volume'] / volume_ma,
+            # Price change percentage
+            'Price_Change_Pct': close.pct_change() * 100,
+            # High and Low of recent periods for stop-loss/take-profit
+            'Recent_High': data['High'].rolling(window=10).max(),
+            'Recent_Low': data['Low'].rolling(window=10).min(),
+        })
     
     def generate_enhanced_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Generate enhanced trading signals with comprehensive sell logic"""
-        data = data.copy()
-        
-        # Calculate technical indicators
+        # Calculate technical indicators (returns a new frame, so the caller's data is left untouched)
         data = self.calculate_technical_indicators(data)
         
         # Initialize signals
         data['Signal'] = SIGNAL_HOLD
         data['Position'] = 0
         data['Signal_Reason'] = 'No Signal'
-        data['Signal_Strength'] = 'WEAK'
         
         # Get technical indicator values
         sma_short = data[f'SMA_{SMA_SHORT_PERIOD}']
         sma_long = data[f'SMA_{SMA_LONG_PERIOD}']
         rsi = data['RSI']
-        volume_ratio = data['Volume'] / data['Volume_MA']
+        volume_ratio = data['Volume_Ratio']
         
         # BUY SIGNALS - LONG TERM FOCUSED
         # 1. SMA Crossover + RSI not extremely overbought
@@ -230,7 +563,8 @@ class IndonesianStockBot:
         sell_high_volume = (volume_ratio > HIGH_VOLUME_SELL_MULTIPLIER) & (data['Price_Change_Pct'] < -5)  # Increased from -2%
         
         # 4. Bearish divergence (more conservative for long-term)
-        price_trend = data['Close'].rolling(10).mean() > data['Close'].rolling(10).mean().shift(10)  # Longer period
+        close_ma_10 = data['Close'].rolling(10).mean()
+        price_trend = close_ma_10 > close_ma_10.shift(10)  # Longer period
         rsi_trend = rsi < rsi.shift(10)  # Longer period
         sell_divergence = price_trend & rsi_trend & (rsi > 70)  # Higher RSI threshold
         
@@ -275,39 +609,42 @@ class IndonesianStockBot:
     
     def validate_signal(self, data: pd.DataFrame, symbol: str) -> Dict:
         """Validate and analyze the latest signal with enhanced sell information"""
-        latest_data = data.iloc[-1]
-        previous_data = data.iloc[-2] if len(data) > 1 else latest_data
+        # Read the last two rows as plain floats once instead of label lookups on mixed-dtype row Series
+        tail = data.iloc[-2:]
+        rows = tail[list(VALIDATION_COLUMNS)].to_numpy(dtype=float)
+        close, volume, volume_ratio, sma_short, sma_long, rsi, recent_high, recent_low = rows[-1]
+        previous_close = rows[0][0]  # Same as the latest close when there is only one row
         
         # Calculate stop-loss and take-profit levels for current position
-        current_price = latest_data['Close']
+        current_price = close
         stop_loss_price = current_price * (1 - STOP_LOSS_PERCENTAGE)
         take_profit_price = current_price * (1 + TAKE_PROFIT_PERCENTAGE)
         
         signal_info = {
             'symbol': symbol,
-            'date': latest_data.name.strftime('%Y-%m-%d'),
-            'signal': latest_data['Signal'],
-            'signal_reason': latest_data['Signal_Reason'],
-            'current_price': round(latest_data['Close'], 2),
-            'previous_close': round(previous_data['Close'], 2),
-            'price_change': round(((latest_data['Close'] - previous_data['Close']) / previous_data['Close']) * 100, 2),
-            'volume': int(latest_data['Volume']),
-            'volume_ratio': round(latest_data['Volume'] / latest_data['Volume_MA'], 2) if not pd.isna(latest_data['Volume_MA']) else 1.0,
-            'sma_short': round(latest_data[f'SMA_{SMA_SHORT_PERIOD}'], 2),
-            'sma_long': round(latest_data[f'SMA_{SMA_LONG_PERIOD}'], 2),
-            'rsi': round(latest_data['RSI'], 2) if not pd.isna(latest_data['RSI']) else 50,
+            'date': tail.index[-1].strftime('%Y-%m-%d'),
+            'signal': tail['Signal'].iat[-1],
+            'signal_reason': tail['Signal_Reason'].iat[-1],
+            'current_price': round(close, 2),
+            'previous_close': round(previous_close, 2),
+            'price_change': round(((close - previous_close) / previous_close) * 100, 2),
+            'volume': int(volume),
+            'volume_ratio': round(volume_ratio, 2) if not np.isnan(volume_ratio) else 1.0,
+            'sma_short': round(sma_short, 2),
+            'sma_long': round(sma_long, 2),
+            'rsi': round(rsi, 2) if not np.isnan(rsi) else 50,
             'stop_loss_price': round(stop_loss_price, 2),
             'take_profit_price': round(take_profit_price, 2),
-            'recent_high': round(latest_data['Recent_High'], 2),
-            'recent_low': round(latest_data['Recent_Low'], 2),
+            'recent_high': round(recent_high, 2),
+            'recent_low': round(recent_low, 2),
             'valid': False,
             'strength': 'WEAK'
         }
         
         # Validation criteria
-        volume_valid = latest_data['Volume'] >= MIN_VOLUME_THRESHOLD
+        volume_valid = volume >= MIN_VOLUME_THRESHOLD
         price_change_significant = abs(signal_info['price_change']) >= MIN_PRICE_CHANGE * 100
-        sma_valid = not (pd.isna(latest_data[f'SMA_{SMA_SHORT_PERIOD}']) or pd.isna(latest_data[f'SMA_{SMA_LONG_PERIOD}']))
+        sma_valid = not (np.isnan(sma_short) or np.isnan(sma_long))
         
         signal_info['valid'] = volume_valid and sma_valid
         
@@ -321,135 +658,198 @@ class IndonesianStockBot:
         
         return signal_info
     
+    def _get_chart_figure(self):
+        """Return the cached chart figure and axes, building them on first use"""
+        if self._chart_figure is None:
+            import matplotlib.dates as mdates
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            
+            _init_chart_style()
+            self._volume_date_formatter = mdates.DateFormatter('%m-%d')
+            self._volume_date_locator = mdates.WeekdayLocator()
+            # A bare Agg-backed Figure skips pyplot's global figure manager and backend selection
+            self._chart_figure = Figure(figsize=(14, 12), dpi=CHART_DPI)
+            FigureCanvasAgg(self._chart_figure)
+            self._chart_axes = self._chart_figure.subplots(3, 1, height_ratios=[3, 1, 1])
+            # Fixed margins replace a per-call tight_layout/bbox_inches='tight' layout pass
+            self._chart_figure.subplots_adjust(left=0.07, right=0.98, top=0.94, bottom=0.07, hspace=0.3)
+        return self._chart_figure, self._chart_axes
+    
     def create_enhanced_chart(self, data: pd.DataFrame, symbol: str, signal_info: Dict) -> BytesIO:
         """Create an enhanced chart with RSI and sell signal indicators"""
-        plt.style.use('dark_background')
-        fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(14, 12), height_ratios=[3, 1, 1])
+        cache_key = self._chart_cache_key(data, symbol, signal_info)
+        
+        # The cached figure is shared, so only one chart is drawn at a time
+        with self._chart_lock:
+            png = self._chart_cache.get(cache_key)
+            if png is not None:
+                self._chart_cache.move_to_end(cache_key)
+                return BytesIO(png)
+            
+            fig, axes = self._get_chart_figure()
+            for ax in axes:
+                ax.cla()
+            img_buffer = self._draw_enhanced_chart(fig, axes, data, symbol, signal_info)
+            
+            self._chart_cache[cache_key] = img_buffer.getvalue()
+            if len(self._chart_cache) > CHART_CACHE_SIZE:
+                self._chart_cache.popitem(last=False)
         
-        # Price and SMA plot
-        ax1.plot(data.index, data['Close'], label='Close Price', color='white', linewidth=2)
-        ax1.plot(data.index, data[f'SMA_{SMA_SHORT_PERIOD}'], label=f'SMA {SMA_SHORT_PERIOD}', color='orange', alpha=0.8)
-        ax1.plot(data.index, data[f'SMA_{SMA_LONG_PERIOD}'], label=f'SMA {SMA_LONG_PERIOD}', color='blue', alpha=0.8)
+        img_buffer.seek(0)
+        return img_buffer
+    
+    @staticmethod
+    def _chart_cache_key(data: pd.DataFrame, symbol: str, signal_info: Dict) -> Tuple:
+        """Build a hashable key identifying a chart by symbol, latest bar and scalar signal fields"""
+        signal_items = tuple(sorted(
+            (key, value) for key, value in signal_info.items()
+            if isinstance(value, (str, int, float, bool, np.generic))
+        ))
+        return (symbol, data.index[-1], len(data), signal_items)
+    
+    async def run_blocking(self, func, *args):
+        """Run blocking fetch or pandas work on the bounded analysis pool without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._analysis_executor, func, *args)
+    
+    async def render_enhanced_chart(self, data: pd.DataFrame, symbol: str, signal_info: Dict) -> BytesIO:
+        """Create the enhanced chart on the chart worker thread without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._chart_executor, self.create_enhanced_chart, data, symbol, signal_info)
+    
+    def _draw_enhanced_chart(self, fig, axes, data: pd.DataFrame, symbol: str, signal_info: Dict) -> BytesIO:
+        """Draw price, RSI and volume panels onto the cleared axes and render to PNG"""
+        import matplotlib.dates as mdates
+        from matplotlib.collections import LineCollection, PolyCollection
+        from matplotlib.lines import Line2D
+        
+        ax1, ax2, ax3 = axes
+        
+        # Line series share one date->float conversion and are downsampled for very long histories
+        # (yfinance indexes are tz-aware; converting to naive UTC datetime64 first keeps date2num vectorised
+        # instead of going through one Python datetime per bar, with identical values)
+        dates = data.index
+        if dates.tz is not None:
+            dates = dates.tz_convert(None)
+        xnum = mdates.date2num(dates.to_numpy())
+        ax1.xaxis_date()
+        ax2.xaxis_date()
+        
+        # Pull every column the chart needs out of the DataFrame once, as plain arrays
+        close = data['Close'].to_numpy(dtype=float)
+        rsi = data['RSI'].to_numpy(dtype=float)
+        volume = data['Volume'].to_numpy(dtype=float)
+        volume_ratio = data['Volume_Ratio'].to_numpy(dtype=float)
+        signals = data['Signal'].to_numpy()
+        
+        # Axes methods called repeatedly below
+        scatter = ax1.scatter
+        price_axhline = ax1.axhline
+        rsi_axhline = ax2.axhline
+        
+        # Price and SMA plot, batched into a single collection (LTTB also drops the SMA warm-up NaNs)
+        price_segments = [np.column_stack(downsample_lttb(xnum, data[column].to_numpy(dtype=float)))
+                          for column, _, _, _ in PRICE_LINE_SERIES]
+        ax1.add_collection(LineCollection(price_segments,
+                                          colors=[color for _, _, color, _ in PRICE_LINE_SERIES],
+                                          linewidths=[width for _, _, _, width in PRICE_LINE_SERIES]))
+        ax1.autoscale_view()
         
         # Mark signals
-        buy_signals = data[data['Signal'] == SIGNAL_BUY]
-        sell_signals = data[data['Signal'] == SIGNAL_SELL]
-        strong_sell_signals = data[data['Signal'] == SIGNAL_STRONG_SELL]
-        
-        if not buy_signals.empty:
-            ax1.scatter(buy_signals.index, buy_signals['Close'], color='green', marker='^', s=100, label='Buy Signal', zorder=5)
-        
-        if not sell_signals.empty:
-            ax1.scatter(sell_signals.index, sell_signals['Close'], color='red', marker='v', s=100, label='Sell Signal', zorder=5)
-            
-        if not strong_sell_signals.empty:
-            ax1.scatter(strong_sell_signals.index, strong_sell_signals['Close'], color='darkred', marker='v', s=150, label='Strong Sell', zorder=5)
+        for signal, color, marker, size, label in SIGNAL_MARKERS:
+            mask = signals == signal
+            if mask.any():
+                scatter(xnum[mask], close[mask], color=color, marker=marker, s=size, label=label, zorder=5)
         
         # Add stop-loss and take-profit lines for current price
         current_price = signal_info['current_price']
-        ax1.axhline(y=signal_info['stop_loss_price'], color='red', linestyle='--', alpha=0.7, label=f'Stop Loss ({signal_info["stop_loss_price"]})')
-        ax1.axhline(y=signal_info['take_profit_price'], color='green', linestyle='--', alpha=0.7, label=f'Take Profit ({signal_info["take_profit_price"]})')
+        price_axhline(y=signal_info['stop_loss_price'], color='red', linestyle='--', alpha=0.7, label=f'Stop Loss ({signal_info["stop_loss_price"]})')
+        price_axhline(y=signal_info['take_profit_price'], color='green', linestyle='--', alpha=0.7, label=f'Take Profit ({signal_info["take_profit_price"]})')
         
         ax1.set_title(f'{symbol} - Long-Term Trend Strategy\nCurrent: {signal_info["current_price"]} ({signal_info["price_change"]:+.2f}%) | RSI: {signal_info["rsi"]:.1f}', 
                      fontsize=14, fontweight='bold')
         ax1.set_ylabel('Price (IDR)', fontsize=12)
-        ax1.legend(loc='upper left', fontsize=8)
+        # Collections have no per-line legend entries, so the price lines get proxy handles
+        line_handles = [Line2D([], [], color=color, linewidth=width, label=label)
+                        for _, label, color, width in PRICE_LINE_SERIES]
+        other_handles, _ = ax1.get_legend_handles_labels()
+        ax1.legend(handles=line_handles + other_handles, loc='upper left', fontsize=8)
         ax1.grid(True, alpha=0.3)
         
         # RSI plot
-        ax2.plot(data.index, data['RSI'], label='RSI', color='yellow', linewidth=1.5)
-        ax2.axhline(y=RSI_OVERBOUGHT_THRESHOLD, color='red', linestyle='--', alpha=0.7, label=f'Overbought ({RSI_OVERBOUGHT_THRESHOLD})')
-        ax2.axhline(y=RSI_OVERSOLD_THRESHOLD, color='green', linestyle='--', alpha=0.7, label=f'Oversold ({RSI_OVERSOLD_THRESHOLD})')
-        ax2.axhline(y=50, color='gray', linestyle='-', alpha=0.5)
+        ax2.plot(*downsample_lttb(xnum, rsi), label='RSI', color='yellow', linewidth=1.5)
+        rsi_axhline(y=RSI_OVERBOUGHT_THRESHOLD, color='red', linestyle='--', alpha=0.7, label=f'Overbought ({RSI_OVERBOUGHT_THRESHOLD})')
+        rsi_axhline(y=RSI_OVERSOLD_THRESHOLD, color='green', linestyle='--', alpha=0.7, label=f'Oversold ({RSI_OVERSOLD_THRESHOLD})')
+        rsi_axhline(y=50, color='gray', linestyle='-', alpha=0.5)
         ax2.set_ylabel('RSI', fontsize=10)
         ax2.set_ylim(0, 100)
         ax2.legend(loc='upper left', fontsize=8)
         ax2.grid(True, alpha=0.3)
         
-        # Volume plot with ratio
-        colors = ['red' if ratio > HIGH_VOLUME_SELL_MULTIPLIER else 'gray' for ratio in data['Volume'] / data['Volume_MA']]
-        ax3.bar(data.index, data['Volume'], color=colors, alpha=0.6)
+        # Volume plot with ratio, drawn as one collection instead of one Rectangle per bar
+        high_volume = volume_ratio > HIGH_VOLUME_SELL_MULTIPLIER
+        bar_colors = np.where(high_volume[:, None], VOLUME_ALERT_RGBA, VOLUME_NORMAL_RGBA)
+        
+        bar_x = xnum
+        bar_top = volume
+        bar_left = bar_x - VOLUME_BAR_WIDTH / 2
+        bar_right = bar_x + VOLUME_BAR_WIDTH / 2
+        bar_bottom = np.zeros_like(bar_top)
+        verts = np.stack([
+            np.column_stack([bar_left, bar_bottom]),
+            np.column_stack([bar_left, bar_top]),
+            np.column_stack([bar_right, bar_top]),
+            np.column_stack([bar_right, bar_bottom]),
+        ], axis=1)
+        ax3.add_collection(PolyCollection(verts, facecolors=bar_colors, edgecolors='none'))
+        ax3.xaxis_date()
+        ax3.autoscale_view()
+        ax3.set_ylim(bottom=0)
         ax3.set_title('Volume (Red = High Volume Alert)', fontsize=10)
         ax3.set_ylabel('Volume', fontsize=10)
         ax3.grid(True, alpha=0.3)
         
         # Format x-axis
-        ax3.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d'))
-        ax3.xaxis.set_major_locator(mdates.WeekdayLocator())
-        plt.setp(ax3.xaxis.get_majorticklabels(), rotation=45)
-        
-        plt.tight_layout()
+        ax3.xaxis.set_major_formatter(self._volume_date_formatter)
+        ax3.xaxis.set_major_locator(self._volume_date_locator)
+        ax3.tick_params(axis='x', labelrotation=45)
         
         # Save to BytesIO
         img_buffer = BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight', facecolor='black')
-        img_buffer.seek(0)
-        plt.close()
+        fig.savefig(img_buffer, format='png', dpi=CHART_DPI, facecolor='black',
+                    pil_kwargs={'compress_level': CHART_PNG_COMPRESS_LEVEL})
         
         return img_buffer
     
     def format_enhanced_signal_message(self, signal_info: Dict, chatgpt_confirmation: Optional[Dict] = None) -> str:
         """Format enhanced signal information for Telegram message"""
-        emoji_map = {
-            SIGNAL_BUY: "🟢",
-            SIGNAL_SELL: "🔴",
-            SIGNAL_STRONG_SELL: "🚨",
-            SIGNAL_HOLD: "🟡"
-        }
-        
-        strength_emoji = {
-            'VERY_STRONG': "🚨🚨",
-            'STRONG': "💪",
-            'MODERATE': "👍",
-            'WEAK': "👎"
-        }
-        
-        signal_emoji = emoji_map.get(signal_info['signal'], "⚪")
-        strength_emoji_icon = strength_emoji.get(signal_info['strength'], "")
+        signal_emoji = self.SIGNAL_EMOJI.get(signal_info['signal'], "⚪")
+        strength_emoji_icon = self.STRENGTH_EMOJI.get(signal_info['strength'], "")
         
         # RSI interpretation
-        rsi_status = ""
         if signal_info['rsi'] > RSI_OVERBOUGHT_THRESHOLD:
-            rsi_status = "🔴 OVERBOUGHT"
+            rsi_status = "OVERBOUGHT"
         elif signal_info['rsi'] < RSI_OVERSOLD_THRESHOLD:
-            rsi_status = "🟢 OVERSOLD"
+            rsi_status = "OVERSOLD"
         else:
-            rsi_status = "🟡 NEUTRAL"
-        
-        # Volume analysis
-        volume_status = "🔴 HIGH VOLUME" if signal_info['volume_ratio'] > HIGH_VOLUME_SELL_MULTIPLIER else "🟡 NORMAL"
+            rsi_status = "NEUTRAL"
         
         # ChatGPT confirmation section
         chatgpt_section = ""
         if chatgpt_confirmation and ENABLE_CHATGPT_CONFIRMATION:
-            confidence_emoji = "🟢" if chatgpt_confirmation['confidence'] >= 0.8 else "🟡" if chatgpt_confirmation['confidence'] >= 0.6 else "🔴"
-            recommendation_emoji = {
-                'CONFIRM': "✅",
-                'REJECT': "❌", 
-                'MODIFY': "⚠️",
-                'PROCEED_WITH_CAUTION': "⚠️"
-            }.get(chatgpt_confirmation.get('recommendation', 'CONFIRM'), "❓")
-            
-            risk_emoji = {
-                'LOW': "🟢",
-                'MEDIUM': "🟡",
-                'HIGH': "🔴",
-                'UNKNOWN': "❓"
-            }.get(chatgpt_confirmation.get('risk_assessment', 'MEDIUM'), "❓")
+            confidence = to_float(chatgpt_confirmation.get('confidence'), 0.5)
+            confidence_emoji = "🟢" if confidence >= 0.8 else "🟡" if confidence >= 0.6 else "🔴"
+            recommendation_emoji = self.RECOMMENDATION_EMOJI.get(chatgpt_confirmation.get('recommendation', 'CONFIRM'), "❓")
+            risk_emoji = self.RISK_EMOJI.get(chatgpt_confirmation.get('risk_assessment', 'MEDIUM'), "❓")
             
             # Sentiment analysis section
             sentiment_section = ""
             if ENABLE_SENTIMENT_ANALYSIS and 'sentiment_analysis' in chatgpt_confirmation:
                 sentiment_data = chatgpt_confirmation['sentiment_analysis']
-                sentiment_emoji = {
-                    'VERY_POSITIVE': "🚀",
-                    'POSITIVE': "📈",
-                    'NEUTRAL': "➡️",
-                    'NEGATIVE': "📉",
-                    'VERY_NEGATIVE': "💥"
-                }.get(sentiment_data.get('overall_sentiment', 'NEUTRAL'), "❓")
+                sentiment_emoji = self.SENTIMENT_EMOJI.get(sentiment_data.get('overall_sentiment', 'NEUTRAL'), "❓")
                 
-                sentiment_score = sentiment_data.get('sentiment_score', 0.5)
+                sentiment_score = to_float(sentiment_data.get('sentiment_score'), 0.5)
                 sentiment_color = "🟢" if sentiment_score >= 0.7 else "🟡" if sentiment_score >= 0.4 else "🔴"
                 
                 sentiment_section = f"\n📊 Sentiment: {sentiment_emoji} {sentiment_data.get('overall_sentiment', 'NEUTRAL')} ({sentiment_color} {sentiment_score:.0%})"
@@ -460,7 +860,7 @@ class IndonesianStockBot:
             
             chatgpt_section = f"""
 🤖 **AI Summary:** {analysis_type_emoji} {analysis_type}
-{recommendation_emoji} {chatgpt_confirmation.get('recommendation', 'N/A')} | {confidence_emoji} {chatgpt_confirmation.get('confidence', 0.5):.0%} | {risk_emoji} {chatgpt_confirmation.get('risk_assessment', 'MEDIUM')}{sentiment_section}
+{recommendation_emoji} {chatgpt_confirmation.get('recommendation', 'N/A')} | {confidence_emoji} {confidence:.0%} | {risk_emoji} {chatgpt_confirmation.get('risk_assessment', 'MEDIUM')}{sentiment_section}
 📋 Detailed analysis sent separately"""
         
         message = f"""
@@ -468,7 +868,7 @@ class IndonesianStockBot:
 
 {signal_emoji} **{signal_info['signal']}** {strength_emoji_icon} | {signal_info['signal_reason']}
 💰 {signal_info['current_price']:,} IDR ({signal_info['price_change']:+.2f}%)
-📊 Vol: {signal_info['volume_ratio']:.1f}x | RSI: {signal_info['rsi']:.0f} ({rsi_status.split()[1] if len(rsi_status.split()) > 1 else rsi_status})
+📊 Vol: {signal_info['volume_ratio']:.1f}x | RSI: {signal_info['rsi']:.0f} ({rsi_status})
 
 📈 SMA: {signal_info['sma_short']:,} / {signal_info['sma_long']:,}
 🎯 SL: {signal_info['stop_loss_price']:,} | TP: {signal_info['take_profit_price']:,}
@@ -484,32 +884,21 @@ class IndonesianStockBot:
         """Format detailed AI analysis as a separate comprehensive message"""
         
         # Recommendation emoji
-        recommendation_emoji = {
-            'CONFIRM': "✅",
-            'REJECT': "❌",
-            'MODIFY': "⚠️",
-            'HOLD': "🟡",
-            'PROCEED_WITH_CAUTION': "⚠️"
-        }.get(chatgpt_confirmation.get('recommendation', 'UNKNOWN'), "❓")
+        recommendation_emoji = self.RECOMMENDATION_EMOJI.get(chatgpt_confirmation.get('recommendation', 'UNKNOWN'), "❓")
         
         # Confidence color
-        confidence = chatgpt_confirmation.get('confidence', 0.5)
+        confidence = to_float(chatgpt_confirmation.get('confidence'), 0.5)
         conf_emoji = "🟢" if confidence >= 0.8 else "🟡" if confidence >= 0.6 else "🔴"
         
         # Risk color
-        risk_emoji = {
-            'LOW': "🟢",
-            'MEDIUM': "🟡", 
-            'HIGH': "🔴",
-            'UNKNOWN': "❓"
-        }.get(chatgpt_confirmation.get('risk_assessment', 'MEDIUM'), "❓")
+        risk_emoji = self.RISK_EMOJI.get(chatgpt_confirmation.get('risk_assessment', 'MEDIUM'), "❓")
         
         # Analysis type information
         analysis_type_emoji = "👁️📊" if chatgpt_confirmation.get('vision_enabled', False) else "📊"
         analysis_type = chatgpt_confirmation.get('analysis_type', 'Statistical Only')
         
-        # Start building the detailed message
-        ai_message = f"""🤖 **COMPREHENSIVE AI ANALYSIS - {signal_info['symbol']}**
+        # Sections are collected in a list and joined once at the end
+        parts = [f"""🤖 **COMPREHENSIVE AI ANALYSIS - {signal_info['symbol']}**
 {analysis_type_emoji} **Analysis Type**: {analysis_type}
 
 📊 **RECOMMENDATION SUMMARY**
@@ -520,57 +909,50 @@ class IndonesianStockBot:
 💭 **COMPREHENSIVE ANALYSIS**
 {chatgpt_confirmation.get('analysis', 'No detailed analysis available')}
 
-🔑 **KEY FACTORS**"""
+🔑 **KEY FACTORS**"""]
         
         # Add key factors
         key_factors = chatgpt_confirmation.get('key_factors', [])
         if key_factors:
-            for i, factor in enumerate(key_factors, 1):
-                ai_message += f"\n{i}. {factor}"
+            parts.extend(f"\n{i}. {factor}" for i, factor in enumerate(key_factors, 1))
         else:
-            ai_message += "\n• No specific key factors identified"
+            parts.append("\n• No specific key factors identified")
         
         # Add statistical analysis section if available
         if 'statistical_analysis' in chatgpt_confirmation:
             stats = chatgpt_confirmation['statistical_analysis']
-            ai_message += f"""
+            parts.append(f"""
 
 📊 **STATISTICAL ANALYSIS BREAKDOWN**
-🎯 **Technical Score**: {stats.get('technical_score', 0.5):.1%}
+🎯 **Technical Score**: {format_number(stats.get('technical_score', 0.5), '.1%')}
 📈 **Volume Confirmation**: {stats.get('volume_confirmation', 'N/A')}
 📊 **RSI Assessment**: {stats.get('rsi_assessment', 'N/A')}
 📈 **SMA Trend**: {stats.get('sma_trend', 'N/A')}
-🎯 **Signal Reliability**: {stats.get('signal_reliability', 'N/A')}"""
+🎯 **Signal Reliability**: {stats.get('signal_reliability', 'N/A')}""")
         
         # Add visual analysis section if available
         if chatgpt_confirmation.get('vision_enabled', False) and 'visual_analysis' in chatgpt_confirmation:
             visual = chatgpt_confirmation['visual_analysis']
-            ai_message += f"""
+            parts.append(f"""
 
 👁️ **VISUAL CHART ANALYSIS**
 📈 **Chart Pattern**: {visual.get('chart_pattern', 'No specific pattern identified')}
 📊 **Trend Direction**: {visual.get('trend_direction', 'N/A')}
 🎯 **Support/Resistance**: {visual.get('support_resistance', 'No clear levels identified')}
 ✅ **Visual Confirmation**: {visual.get('visual_confirmation', 'N/A')}
-💪 **Chart Strength**: {visual.get('chart_strength', 'N/A')}"""
+💪 **Chart Strength**: {visual.get('chart_strength', 'N/A')}""")
         
         # Add sentiment analysis if available
         if ENABLE_SENTIMENT_ANALYSIS and 'sentiment_analysis' in chatgpt_confirmation:
             sentiment = chatgpt_confirmation['sentiment_analysis']
             
             # Overall sentiment with emoji
-            sentiment_emoji = {
-                'VERY_POSITIVE': "🚀",
-                'POSITIVE': "📈", 
-                'NEUTRAL': "➡️",
-                'NEGATIVE': "📉",
-                'VERY_NEGATIVE': "💥"
-            }.get(sentiment.get('overall_sentiment', 'NEUTRAL'), "❓")
+            sentiment_emoji = self.SENTIMENT_EMOJI.get(sentiment.get('overall_sentiment', 'NEUTRAL'), "❓")
             
-            sentiment_score = sentiment.get('sentiment_score', 0.5)
+            sentiment_score = to_float(sentiment.get('sentiment_score'), 0.5)
             score_emoji = "🟢" if sentiment_score >= 0.7 else "🟡" if sentiment_score >= 0.4 else "🔴"
             
-            ai_message += f"""
+            parts.append(f"""
 
 📊 **COMPREHENSIVE SENTIMENT ANALYSIS**
 {sentiment_emoji} **Overall Sentiment**: {sentiment.get('overall_sentiment', 'NEUTRAL')}
@@ -592,80 +974,78 @@ class IndonesianStockBot:
 {sentiment.get('market_mood', 'No market mood analysis available')}
 
 💭 **Sentiment Reasoning**
-{sentiment.get('sentiment_reasoning', 'No sentiment reasoning available')}"""
+{sentiment.get('sentiment_reasoning', 'No sentiment reasoning available')}""")
         
         # Add additional notes if available
         additional_notes = chatgpt_confirmation.get('additional_notes', '')
         if additional_notes:
-            ai_message += f"""
+            parts.append(f"""
 
 📝 **ADDITIONAL INSIGHTS**
-{additional_notes}"""
+{additional_notes}""")
         
         # Add enhanced trading recommendation if available
         if 'trading_recommendation' in chatgpt_confirmation:
             trading_rec = chatgpt_confirmation['trading_recommendation']
-            ai_message += f"""
+            parts.append(f"""
 
 💼 **ENHANCED TRADING STRATEGY**
 🎯 **Entry Strategy**: {trading_rec.get('entry_strategy', 'Follow standard signal guidelines')}
 🚪 **Exit Strategy**: {trading_rec.get('exit_strategy', 'Use predefined stop loss and take profit levels')}
 📏 **Position Sizing**: {trading_rec.get('position_sizing', 'Use appropriate risk management')}
-⚠️ **Risk Management**: {trading_rec.get('risk_management', 'Standard risk management applies')}"""
+⚠️ **Risk Management**: {trading_rec.get('risk_management', 'Standard risk management applies')}""")
         
         # Add trading recommendation based on signal
-        ai_message += f"""
+        parts.append(f"""
 
-🎯 **TRADING RECOMMENDATION**"""
+🎯 **TRADING RECOMMENDATION**""")
         
         if signal_info['signal'] == SIGNAL_BUY:
-            ai_message += f"""
+            parts.append(f"""
 🟢 **BUY RECOMMENDATION**
 • Entry Point: Around {signal_info['current_price']:,} IDR
 • Stop Loss: {signal_info['stop_loss_price']:,} IDR (-5%)
 • Take Profit: {signal_info['take_profit_price']:,} IDR (+10%)
-• Risk/Reward Ratio: 1:2 (favorable)"""
+• Risk/Reward Ratio: 1:2 (favorable)""")
         
         elif signal_info['signal'] == SIGNAL_SELL:
-            ai_message += f"""
+            parts.append(f"""
 🔴 **SELL RECOMMENDATION**
 • Current holders should consider taking profits
 • Avoid new long positions at current levels
 • Monitor for potential re-entry at lower levels
-• Consider partial position reduction"""
+• Consider partial position reduction""")
         
         elif signal_info['signal'] == SIGNAL_STRONG_SELL:
-            ai_message += f"""
+            parts.append(f"""
 🚨 **STRONG SELL RECOMMENDATION**
 • Exit all positions immediately
 • High probability of further decline
 • Consider short positions if available
-• Avoid any new long positions"""
+• Avoid any new long positions""")
         
         elif signal_info['signal'] == SIGNAL_HOLD:
-            ai_message += f"""
+            parts.append(f"""
 🟡 **HOLD RECOMMENDATION**
 • Maintain current positions if any
 • No clear directional signal at this time
 • Monitor for better entry/exit opportunities
-• Consider dollar-cost averaging if long-term bullish"""
+• Consider dollar-cost averaging if long-term bullish""")
         
-        ai_message += f"""
+        parts.append(f"""
 
 ⚠️ **Risk Management Reminder**
 Always use proper position sizing and never risk more than you can afford to lose. This analysis is for educational purposes only.
-        """
+        """)
         
-        return ai_message.strip()
+        return "".join(parts).strip()
     
     def encode_chart_image(self, chart_buffer: BytesIO) -> str:
         """Convert chart image to base64 for ChatGPT Vision analysis"""
         try:
-            chart_buffer.seek(0)
-            image_data = chart_buffer.read()
-            base64_image = base64.b64encode(image_data).decode('utf-8')
-            chart_buffer.seek(0)  # Reset buffer position
-            return base64_image
+            # Encode straight from the buffer's memory; the read position is left untouched for Telegram
+            with chart_buffer.getbuffer() as image_data:
+                return base64.b64encode(image_data).decode('ascii')
         except Exception as e:
             logger.error(f"Error encoding chart image: {e}")
             return ""
@@ -673,12 +1053,8 @@ Always use proper position sizing and never risk more than you can afford to los
     async def get_chatgpt_confirmation(self, signal_info: Dict, chart_buffer: Optional[BytesIO] = None) -> Dict:
         """Get ChatGPT confirmation with advanced analysis and optional chart vision"""
         if not self.openai_client or not ENABLE_CHATGPT_CONFIRMATION:
-            return {
-                'confirmed': True,
-                'confidence': 1.0,
-                'analysis': 'ChatGPT confirmation disabled',
-                'recommendation': 'Proceed with original signal'
-            }
+            # Copied because callers adjust the confidence in place
+            return CHATGPT_DISABLED_RESULT.copy()
         
         try:
             # Prepare market data for analysis
@@ -964,20 +1340,16 @@ Please respond in JSON format:
                     # Try to parse JSON response
                     try:
                         # Extract JSON from response if it's wrapped in markdown
-                        if "```json" in chatgpt_response:
-                            json_start = chatgpt_response.find("```json") + 7
-                            json_end = chatgpt_response.find("```", json_start)
-                            chatgpt_response = chatgpt_response[json_start:json_end].strip()
-                        elif "```" in chatgpt_response:
-                            json_start = chatgpt_response.find("```") + 3
-                            json_end = chatgpt_response.rfind("```")
-                            chatgpt_response = chatgpt_response[json_start:json_end].strip()
+                        chatgpt_response = self._strip_json_fence(chatgpt_response)
                         
-                        analysis_result = json.loads(chatgpt_response)
+                        analysis_result = orjson.loads(chatgpt_response)
                         
                         # Validate required fields
                         required_fields = ['confirmed', 'confidence', 'analysis', 'recommendation']
                         if all(field in analysis_result for field in required_fields):
+                            # Thresholds and message formatting below expect a numeric confidence
+                            analysis_result['confidence'] = to_float(analysis_result['confidence'], 0.5)
+                            
                             # Enhanced logging with analysis type
                             analysis_type = "Vision + Statistical" if use_vision else "Statistical Only"
                             visual_conf = ""
@@ -995,7 +1367,7 @@ Please respond in JSON format:
                         else:
                             logger.warning(f"ChatGPT response missing required fields: {chatgpt_response}")
                             
-                    except json.JSONDecodeError as e:
+                    except orjson.JSONDecodeError as e:
                         logger.warning(f"Failed to parse ChatGPT JSON response: {e}")
                         logger.warning(f"Raw response: {chatgpt_response}")
                         
@@ -1031,19 +1403,121 @@ Please respond in JSON format:
                 'key_factors': ['Technical analysis only'],
                 'additional_notes': 'ChatGPT confirmation unavailable',
                 'analysis_type': 'Error Fallback',
-                'vision_enabled': False
+                'vision_enabled': False,
+                # Lets bulk callers tell a throttled request apart from a real confirmation
+                'rate_limited': isinstance(e, RateLimitError)
             }
     
+    @staticmethod
+    def _strip_json_fence(response: str) -> str:
+        """Return the JSON payload of a ChatGPT reply, removing a surrounding markdown code fence if present"""
+        if "```json" in response:
+            json_start = response.find("```json") + 7
+            json_end = response.find("```", json_start)
+            return response[json_start:json_end].strip()
+        if "```" in response:
+            json_start = response.find("```") + 3
+            json_end = response.rfind("```")
+            return response[json_start:json_end].strip()
+        return response
+    
+    async def get_chatgpt_confirmations_batch(self, signals: List[Dict]) -> List[Dict]:
+        """Confirm several signals with one text-only ChatGPT request, returning confirmations in input order"""
+        if not signals:
+            return []
+        if not self.openai_client or not ENABLE_CHATGPT_CONFIRMATION:
+            return [CHATGPT_DISABLED_RESULT.copy() for _ in signals]
+        
+        # One compact line of indicators per signal; the shared instructions are sent (and billed) once
+        signal_lines = "\n".join(
+            f"{i}. {s['symbol']}: {s['signal']} ({s['signal_reason']}) | Price {s['current_price']:,} "
+            f"({s['price_change']:+.2f}%) | Volume {s.get('volume_ratio', 1.0):.2f}x avg | RSI {s['rsi']:.1f} | "
+            f"SMA {s['sma_short']:,} / {s['sma_long']:,} | Strength {s['strength']} | "
+            f"SL {s['stop_loss_price']:,} | TP {s['take_profit_price']:,}"
+            for i, s in enumerate(signals)
+        )
+        prompt = f"""
+Evaluate each of the following {len(signals)} trading signals using the statistical data given:
+
+{signal_lines}
+
+For every signal, assess SMA trend, RSI level, volume confirmation and overall signal reliability.
+
+Please respond with a JSON array containing exactly one object per signal, in the same order:
+[
+    {{
+        "index": int,
+        "confirmed": boolean,
+        "confidence": float (0.0-1.0),
+        "analysis": "concise analysis of the signal",
+        "recommendation": "CONFIRM/REJECT/MODIFY/PROCEED_WITH_CAUTION",
+        "risk_assessment": "LOW/MEDIUM/HIGH",
+        "key_factors": ["factor1", "factor2", "factor3"]
+    }}
+]"""
+        messages = [
+            {
+                "role": "system",
+                "content": "You are an expert financial analyst. Provide objective, data-driven analysis of each trading signal."
+            },
+            {"role": "user", "content": prompt}
+        ]
+        
+        symbols = ', '.join(s['symbol'] for s in signals)
+        for attempt in range(CHATGPT_MAX_RETRIES):
+            try:
+                logger.info(f"Requesting batched ChatGPT confirmation for {len(signals)} signals: {symbols} (attempt {attempt + 1})")
+                response = await self.openai_client.chat.completions.create(
+                    model=CHATGPT_MODEL,
+                    messages=messages,
+                    temperature=0.3,
+                    max_tokens=400 * len(signals) + 200
+                )
+                results = orjson.loads(self._strip_json_fence(response.choices[0].message.content.strip()))
+                break
+            except Exception as e:
+                logger.warning(f"Batched ChatGPT confirmation failed (attempt {attempt + 1}): {e}")
+                if attempt < CHATGPT_MAX_RETRIES - 1:
+                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+        else:
+            results = []
+        
+        # Match answers back to signals by their index, falling back per signal for missing or malformed entries
+        by_index = {}
+        if isinstance(results, list):
+            for position, result in enumerate(results):
+                if isinstance(result, dict):
+                    by_index.setdefault(result.get('index', position), result)
+        
+        required_fields = ('confirmed', 'confidence', 'analysis', 'recommendation')
+        confirmations = []
+        for i, signal_info in enumerate(signals):
+            result = by_index.get(i)
+            if result is not None and all(field in result for field in required_fields):
+                result['confidence'] = to_float(result['confidence'], 0.5)
+                result['analysis_type'] = 'Batched Statistical'
+                result['vision_enabled'] = False
+            else:
+                logger.warning(f"No usable batched ChatGPT confirmation for {signal_info['symbol']}")
+                result = {
+                    'confirmed': True,
+                    'confidence': 0.5,
+                    'analysis': 'Batched ChatGPT analysis unavailable for this signal',
+                    'recommendation': 'PROCEED_WITH_CAUTION',
+                    'risk_assessment': 'UNKNOWN',
+                    'key_factors': ['Technical analysis only'],
+                    'additional_notes': 'ChatGPT confirmation unavailable',
+                    'analysis_type': 'Error Fallback',
+                    'vision_enabled': False
+                }
+            confirmations.append(result)
+        return confirmations
+    
     async def send_telegram_message(self, message: str, chart: Optional[BytesIO] = None):
         """Send message to Telegram"""
         try:
             if chart:
-                await self.telegram_bot.send_photo(
-                    chat_id=self.chat_id,
-                    photo=chart,
-                    caption=message,
-                    parse_mode='Markdown'
-                )
+                await self._send_chart(message, chart)
             else:
                 await self.telegram_bot.send_message(
                     chat_id=self.chat_id,
@@ -1058,6 +1532,38 @@ Please respond in JSON format:
         except Exception as e:
             logger.error(f"Unexpected error sending message: {e}")
     
+    async def _send_chart(self, caption: str, chart: BytesIO):
+        """Send a chart photo, reusing the Telegram file_id if the same PNG was uploaded before"""
+        with chart.getbuffer() as png:
+            digest = hashlib.blake2b(png, digest_size=16).digest()
+        file_id = self._chart_file_ids.get(digest)
+        if file_id is not None:
+            self._chart_file_ids.move_to_end(digest)
+            try:
+                await self.telegram_bot.send_photo(
+                    chat_id=self.chat_id,
+                    photo=file_id,
+                    caption=caption,
+                    parse_mode='Markdown'
+                )
+                return
+            except TelegramError as e:
+                # Fall back to uploading the PNG if Telegram no longer accepts the stored file_id
+                logger.warning(f"Cached chart file_id rejected, uploading again: {e}")
+                self._chart_file_ids.pop(digest, None)
+        
+        chart.seek(0)
+        sent = await self.telegram_bot.send_photo(
+            chat_id=self.chat_id,
+            photo=chart,
+            caption=caption,
+            parse_mode='Markdown'
+        )
+        if sent.photo:
+            self._chart_file_ids[digest] = sent.photo[-1].file_id
+            if len(self._chart_file_ids) > CHART_FILE_ID_CACHE_SIZE:
+                self._chart_file_ids.popitem(last=False)
+    
     def is_watchlist_stock(self, symbol: str) -> bool:
         """Check if a stock is in the watchlist"""
         return ENABLE_WATCHLIST and symbol in WATCHLIST_STOCKS
@@ -1074,9 +1580,10 @@ Please respond in JSON format:
             self.watchlist_data[symbol] = {
                 'last_price': signal_info['current_price'],
                 'last_update': current_time,
-                'price_alerts': [],
-                'volume_alerts': [],
-                'signal_history': []
+                # Bounded deques drop the oldest entry on append instead of re-slicing the lists
+                'price_alerts': deque(maxlen=WATCHLIST_HISTORY_SIZE),
+                'volume_alerts': deque(maxlen=WATCHLIST_HISTORY_SIZE),
+                'signal_history': deque(maxlen=WATCHLIST_HISTORY_SIZE)
             }
         
         watchlist_entry = self.watchlist_data[symbol]
@@ -1119,20 +1626,22 @@ Please respond in JSON format:
             'price': current_price,
             'timestamp': current_time
         })
-        
-        # Keep only last 10 alerts and signals
-        watchlist_entry['price_alerts'] = watchlist_entry['price_alerts'][-10:]
-        watchlist_entry['volume_alerts'] = watchlist_entry['volume_alerts'][-10:]
-        watchlist_entry['signal_history'] = watchlist_entry['signal_history'][-10:]
     
     async def send_watchlist_alerts(self):
         """Send accumulated watchlist alerts"""
-        if not ENABLE_WATCHLIST or not self.watchlist_alerts:
+        # Snapshot the pending alerts; new ones may be appended while the message is being sent
+        pending_alerts = tuple(self.watchlist_alerts)
+        if not ENABLE_WATCHLIST or not pending_alerts:
             return
         
-        # Group alerts by type
-        price_alerts = [a for a in self.watchlist_alerts if a['type'] == 'PRICE_MOVE']
-        volume_alerts = [a for a in self.watchlist_alerts if a['type'] == 'HIGH_VOLUME']
+        # Group alerts by type in a single pass
+        price_alerts = []
+        volume_alerts = []
+        for alert in pending_alerts:
+            if alert['type'] == 'PRICE_MOVE':
+                price_alerts.append(alert)
+            elif alert['type'] == 'HIGH_VOLUME':
+                volume_alerts.append(alert)
         
         if not price_alerts and not volume_alerts:
             return
@@ -1158,8 +1667,8 @@ Please respond in JSON format:
         
         await self.send_telegram_message(alert_message)
         
-        # Clear sent alerts
-        self.watchlist_alerts.clear()
+        # Clear sent alerts (alerts are only ever appended, so the snapshot is the list prefix)
+        del self.watchlist_alerts[:len(pending_alerts)]
         logger.info(f"Sent watchlist alerts: {len(price_alerts)} price, {len(volume_alerts)} volume")
     
     async def generate_watchlist_summary(self) -> str:
@@ -1168,6 +1677,7 @@ Please respond in JSON format:
             return ""
         
         summary = "📋 **DAILY WATCHLIST SUMMARY** 📋\n\n"
+        now = datetime.now()  # One clock read for every alert age below
         
         for symbol in WATCHLIST_STOCKS:
             if symbol in self.watchlist_data:
@@ -1175,12 +1685,7 @@ Please respond in JSON format:
                 last_signal = data['signal_history'][-1] if data['signal_history'] else None
                 
                 # Signal emoji
-                signal_emoji = {
-                    SIGNAL_BUY: "🟢",
-                    SIGNAL_SELL: "🔴", 
-                    SIGNAL_STRONG_SELL: "🚨",
-                    SIGNAL_HOLD: "🟡"
-                }.get(last_signal['signal'] if last_signal else SIGNAL_HOLD, "⚪")
+                signal_emoji = self.SIGNAL_EMOJI.get(last_signal['signal'] if last_signal else SIGNAL_HOLD, "⚪")
                 
                 summary += f"{signal_emoji} **{symbol}**\n"
                 summary += f"💰 Price: {data['last_price']:,} IDR\n"
@@ -1189,8 +1694,8 @@ Please respond in JSON format:
                     summary += f"📊 Last Signal: {last_signal['signal']}\n"
                 
                 # Recent alerts count
-                recent_price_alerts = len([a for a in data['price_alerts'] if (datetime.now() - a['timestamp']).days == 0])
-                recent_volume_alerts = len([a for a in data['volume_alerts'] if (datetime.now() - a['timestamp']).days == 0])
+                recent_price_alerts = sum(1 for a in data['price_alerts'] if (now - a['timestamp']).days == 0)
+                recent_volume_alerts = sum(1 for a in data['volume_alerts'] if (now - a['timestamp']).days == 0)
                 
                 if recent_price_alerts > 0:
                     summary += f"📈 Price Alerts Today: {recent_price_alerts}\n"
@@ -1203,18 +1708,55 @@ Please respond in JSON format:
         
         return summary
     
-    async def analyze_stock(self, symbol: str) -> Optional[Dict]:
-        """Analyze a single stock and return enhanced signal info"""
+    async def _fetch_stock_data_shared(self, symbol: str) -> Optional[pd.DataFrame]:
+        """Fetch price history on a worker thread, sharing one fetch between concurrent callers of a symbol"""
+        inflight = self._inflight_fetches.get(symbol)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self.run_blocking(self.fetch_stock_data, symbol))
+            self._inflight_fetches[symbol] = inflight
+            inflight.add_done_callback(lambda _: self._inflight_fetches.pop(symbol, None))
+        
+        # Shield so one cancelled caller doesn't cancel the fetch the others are waiting on
+        return await asyncio.shield(inflight)
+    
+    async def _generate_signals_cached(self, symbol: str, data: pd.DataFrame) -> pd.DataFrame:
+        """Return the signals frame for this price history, reusing it while the latest bar is unchanged"""
+        # The last bar's close and volume move intraday, so they are part of the key
+        cache_key = (symbol, data.index[-1], len(data), data['Close'].iat[-1], data['Volume'].iat[-1])
+        data_with_signals = self._signals_cache.get(cache_key)
+        if data_with_signals is not None:
+            self._signals_cache.move_to_end(cache_key)
+            return data_with_signals
+        
+        data_with_signals = await self.run_blocking(self.generate_enhanced_signals, data)
+        self._signals_cache[cache_key] = data_with_signals
+        if len(self._signals_cache) > SIGNALS_CACHE_SIZE:
+            self._signals_cache.popitem(last=False)
+        return data_with_signals
+    
+    @staticmethod
+    def needs_chatgpt_confirmation(signal_info: Dict) -> bool:
+        """Whether a signal is worth a ChatGPT call: any actionable signal, or a HOLD on unusually high volume"""
+        return signal_info['signal'] != SIGNAL_HOLD or signal_info['volume_ratio'] >= CHATGPT_GATE_VOLUME_RATIO
+    
+    async def analyze_stock(self, symbol: str, data: Optional[pd.DataFrame] = None,
+                            gate_chatgpt: bool = False, send_signals: bool = True,
+                            track_watchlist: bool = True) -> Optional[Dict]:
+        """Analyze a single stock and return enhanced signal info (data may be prefetched by fetch_stocks_data,
+        gate_chatgpt skips the ChatGPT call for signals needs_chatgpt_confirmation rejects, and
+        send_signals=False confirms valid signals without sending them to Telegram, and track_watchlist=False
+        leaves the watchlist history to the caller)"""
         logger.info(f"Analyzing {symbol}...")
         
-        # Fetch data
-        data = self.fetch_stock_data(symbol)
-        if data is None or len(data) < max(SMA_LONG_PERIOD, RSI_PERIOD):
+        # Fetch data (blocking yfinance HTTP and retry sleeps run off the event loop)
+        if data is None:
+            data = await self._fetch_stock_data_shared(symbol)
+        if data is None or len(data) < MIN_HISTORY_BARS:
             logger.warning(f"Insufficient data for {symbol}")
             return None
         
-        # Generate enhanced signals
-        data_with_signals = self.generate_enhanced_signals(data)
+        # Generate enhanced signals (pandas/NumPy work, also kept off the event loop)
+        data_with_signals = await self._generate_signals_cached(symbol, data)
         
         # Validate latest signal
         signal_info = self.validate_signal(data_with_signals, symbol)
@@ -1223,71 +1765,113 @@ Please respond in JSON format:
         if signal_info['signal'] in [SIGNAL_BUY, SIGNAL_SELL, SIGNAL_STRONG_SELL, SIGNAL_HOLD] and signal_info['valid']:
             
             # Create enhanced chart first (needed for both Telegram and ChatGPT)
-            chart = self.create_enhanced_chart(data_with_signals, symbol, signal_info)
+            chart = await self.render_enhanced_chart(data_with_signals, symbol, signal_info)
+            try:
+                ask_chatgpt = not gate_chatgpt or self.needs_chatgpt_confirmation(signal_info)
+                await self._confirm_and_send_signal(symbol, signal_info, chart, ask_chatgpt, send_signals, track_watchlist)
+            finally:
+                # The PNG has been uploaded and encoded by now; release its buffer right away
+                chart.close()
             
-            # Get ChatGPT confirmation with chart for vision analysis
+        return signal_info
+    
+    async def _confirm_and_send_signal(self, symbol: str, signal_info: Dict, chart: BytesIO, ask_chatgpt: bool = True,
+                                       send: bool = True, track_watchlist: bool = True):
+        """Get ChatGPT confirmation for a valid signal and send it to Telegram unless filtered out (or send is False)"""
+        # Get ChatGPT confirmation with chart for vision analysis
+        if ask_chatgpt:
             confirmation = await self.get_chatgpt_confirmation(signal_info, chart)
+        else:
+            logger.info(f"Skipping ChatGPT confirmation for {symbol}: low-volume HOLD signal")
+            confirmation = CHATGPT_SKIPPED_RESULT.copy()
+        
+        # Check if ChatGPT confirms the signal
+        should_send_signal = True
+        confidence_threshold = CHATGPT_CONFIDENCE_THRESHOLD
+        
+        # Special handling for HOLD signals
+        if signal_info['signal'] == SIGNAL_HOLD:
+            if not ENABLE_HOLD_SIGNALS:
+                should_send_signal = False
+                logger.info(f"HOLD signals disabled for {symbol}")
+            elif SEND_HOLD_SIGNALS_REGARDLESS_OF_CONFIDENCE:
+                confidence_threshold = 0.0  # Always send HOLD signals
+                logger.info(f"HOLD signal for {symbol}: Bypassing confidence check")
+            else:
+                confidence_threshold = HOLD_SIGNAL_CONFIDENCE_THRESHOLD
+                logger.info(f"HOLD signal for {symbol}: Using lower threshold {confidence_threshold}")
+        
+        # Lower threshold for watchlist stocks
+        elif self.is_watchlist_stock(symbol):
+            confidence_threshold = WATCHLIST_ALERT_THRESHOLD
+            # Boost confidence for watchlist stocks
+            if 'confidence' in confirmation:
+                confirmation['confidence'] = min(1.0, confirmation['confidence'] * WATCHLIST_PRIORITY_MULTIPLIER)
+            logger.info(f"Watchlist stock {symbol}: Using lower threshold {confidence_threshold} and boosted confidence")
+        
+        if ENABLE_CHATGPT_CONFIRMATION and self.openai_client:
+            # Only send if ChatGPT confirms and confidence is above threshold
+            if confirmation.get('recommendation') == 'REJECT':
+                should_send_signal = False
+                logger.info(f"ChatGPT rejected signal for {symbol}: {confirmation.get('analysis', 'No reason provided')}")
+            elif confirmation.get('confidence', 0) < confidence_threshold:
+                should_send_signal = False
+                logger.info(f"ChatGPT confidence too low for {symbol}: {confirmation.get('confidence', 0):.2f} < {confidence_threshold}")
+        
+        if should_send_signal and not send:
+            logger.info(f"Signal for {symbol} not sent: Telegram sends are disabled for this analysis")
+            signal_info['chatgpt_confirmation'] = confirmation
+        elif should_send_signal:
+            # Format message with ChatGPT confirmation
+            message = self.format_enhanced_signal_message(signal_info, confirmation)
             
-            # Check if ChatGPT confirms the signal
-            should_send_signal = True
-            confidence_threshold = CHATGPT_CONFIDENCE_THRESHOLD
-            
-            # Special handling for HOLD signals
-            if signal_info['signal'] == SIGNAL_HOLD:
-                if not ENABLE_HOLD_SIGNALS:
-                    should_send_signal = False
-                    logger.info(f"HOLD signals disabled for {symbol}")
-                elif SEND_HOLD_SIGNALS_REGARDLESS_OF_CONFIDENCE:
-                    confidence_threshold = 0.0  # Always send HOLD signals
-                    logger.info(f"HOLD signal for {symbol}: Bypassing confidence check")
-                else:
-                    confidence_threshold = HOLD_SIGNAL_CONFIDENCE_THRESHOLD
-                    logger.info(f"HOLD signal for {symbol}: Using lower threshold {confidence_threshold}")
-            
-            # Lower threshold for watchlist stocks
-            elif self.is_watchlist_stock(symbol):
-                confidence_threshold = WATCHLIST_ALERT_THRESHOLD
-                # Boost confidence for watchlist stocks
-                if 'confidence' in confirmation:
-                    confirmation['confidence'] = min(1.0, confirmation['confidence'] * WATCHLIST_PRIORITY_MULTIPLIER)
-                logger.info(f"Watchlist stock {symbol}: Using lower threshold {confidence_threshold} and boosted confidence")
-            
-            if ENABLE_CHATGPT_CONFIRMATION and self.openai_client:
-                # Only send if ChatGPT confirms and confidence is above threshold
-                if confirmation.get('recommendation') == 'REJECT':
-                    should_send_signal = False
-                    logger.info(f"ChatGPT rejected signal for {symbol}: {confirmation.get('analysis', 'No reason provided')}")
-                elif confirmation.get('confidence', 0) < confidence_threshold:
-                    should_send_signal = False
-                    logger.info(f"ChatGPT confidence too low for {symbol}: {confirmation.get('confidence', 0):.2f} < {confidence_threshold}")
-            
-            if should_send_signal:
-                # Format message with ChatGPT confirmation
-                message = self.format_enhanced_signal_message(signal_info, confirmation)
-                
-                # Send to Telegram
+            # Send to Telegram, followed by a separate detailed AI analysis message. The lock keeps another
+            # stock's messages from landing between the two when several stocks are analyzed at once
+            async with self._signal_send_lock:
                 await self.send_telegram_message(message, chart)
                 
-                # Send separate detailed AI analysis message
-                if ENABLE_CHATGPT_CONFIRMATION and self.openai_client and confirmation:
+                if ENABLE_CHATGPT_CONFIRMATION and self.openai_client and ask_chatgpt and confirmation:
                     ai_message = self.format_detailed_ai_analysis(signal_info, confirmation)
                     await self.send_telegram_message(ai_message)
-                
-                # Store in history with ChatGPT confirmation
-                signal_info['chatgpt_confirmation'] = confirmation
-                self.signals_history.append(signal_info)
-                
-                logger.info(f"Signal sent for {symbol}: {signal_info['signal']} - {signal_info['signal_reason']} (ChatGPT: {confirmation.get('recommendation', 'N/A')})")
-            else:
-                logger.info(f"Signal filtered out for {symbol} by ChatGPT confirmation")
-                # Still return signal_info but mark it as filtered
-                signal_info['chatgpt_filtered'] = True
-                signal_info['chatgpt_confirmation'] = confirmation
             
-            # Update watchlist data
-            self.update_watchlist_data(symbol, signal_info)
+            # Store in history with ChatGPT confirmation
+            signal_info['chatgpt_confirmation'] = confirmation
+            self.signals_history.append(signal_info)
             
-        return signal_info
+            logger.info(f"Signal sent for {symbol}: {signal_info['signal']} - {signal_info['signal_reason']} (ChatGPT: {confirmation.get('recommendation', 'N/A')})")
+        else:
+            logger.info(f"Signal filtered out for {symbol} by ChatGPT confirmation")
+            # Still return signal_info but mark it as filtered
+            signal_info['chatgpt_filtered'] = True
+            signal_info['chatgpt_confirmation'] = confirmation
+        
+        # Update watchlist data
+        if track_watchlist:
+            self.update_watchlist_data(symbol, signal_info)
+    
+    async def analyze_stocks_batch(self, symbols: List[str]) -> Dict[str, Optional[Dict]]:
+        """Analyze several stocks with one batched download and one ChatGPT request, without sending to Telegram"""
+        prefetched = await self.run_blocking(self.fetch_stocks_data, symbols)
+        
+        async def analyze_one(symbol: str) -> Optional[Dict]:
+            data = prefetched.get(symbol)
+            if data is None:
+                data = await self._fetch_stock_data_shared(symbol)
+            if data is None or len(data) < MIN_HISTORY_BARS:
+                logger.warning(f"Insufficient data for {symbol}")
+                return None
+            data_with_signals = await self._generate_signals_cached(symbol, data)
+            return self.validate_signal(data_with_signals, symbol)
+        
+        results = dict(zip(symbols, await asyncio.gather(*(analyze_one(symbol) for symbol in symbols))))
+        
+        # Valid signals get their confirmation stored under 'chatgpt_confirmation', as analyze_stock does
+        valid_signals = [signal_info for signal_info in results.values() if signal_info and signal_info['valid']]
+        confirmations = await self.get_chatgpt_confirmations_batch(valid_signals)
+        for signal_info, confirmation in zip(valid_signals, confirmations):
+            signal_info['chatgpt_confirmation'] = confirmation
+        
+        return results
     
     async def run_daily_analysis(self):
         """Run daily analysis for all Indonesian stocks"""
@@ -1320,37 +1904,58 @@ Please respond in JSON format:
         
         await self.send_telegram_message(start_message)
         
-        # Analyze each stock
-        for i, symbol in enumerate(INDONESIAN_STOCKS):
-            try:
-                logger.info(f"Analyzing {symbol} ({i+1}/{len(INDONESIAN_STOCKS)})")
-                signal_info = await self.analyze_stock(symbol)
-                
-                if signal_info and signal_info['signal'] in [SIGNAL_BUY, SIGNAL_SELL, SIGNAL_STRONG_SELL, SIGNAL_HOLD]:
-                    # Check if signal was sent or filtered by ChatGPT
-                    if signal_info.get('chatgpt_filtered', False):
-                        chatgpt_filtered += 1
-                    else:
-                        signals_sent += 1
-                        chatgpt_confirmed += 1
-                        if signal_info['signal'] == SIGNAL_BUY:
-                            buy_signals += 1
-                        elif signal_info['signal'] == SIGNAL_SELL:
-                            sell_signals += 1
-                        elif signal_info['signal'] == SIGNAL_STRONG_SELL:
-                            strong_sell_signals += 1
-                        elif signal_info['signal'] == SIGNAL_HOLD:
-                            hold_signals += 1
-                
-                # Longer delay to avoid rate limiting (3-5 seconds)
-                delay = 3 + (i * 0.5)  # Increasing delay for each stock
-                logger.info(f"Waiting {delay:.1f}s before next analysis...")
-                await asyncio.sleep(delay)
-                
-            except Exception as e:
-                logger.error(f"Error analyzing {symbol}: {e}")
-                # Still wait even on error to avoid rapid requests
-                await asyncio.sleep(2)
+        # Fetch every stock's history in one batched download; symbols missing from it are fetched individually
+        prefetched = await self.run_blocking(self.fetch_stocks_data, INDONESIAN_STOCKS)
+        
+        # Analyze the stocks concurrently, a bounded number at a time
+        semaphore = asyncio.Semaphore(DAILY_ANALYSIS_CONCURRENCY)
+        
+        # Individual Yahoo fetches are spaced out to avoid rate limiting; the wait happens before the fetch
+        # and outside the semaphore, so prefetched stocks keep every analysis slot busy meanwhile
+        loop = asyncio.get_running_loop()
+        fetch_lock = asyncio.Lock()
+        next_fetch_at = 0.0
+        
+        async def pace_individual_fetch():
+            nonlocal next_fetch_at
+            async with fetch_lock:
+                delay = next_fetch_at - loop.time()
+                if delay > 0:
+                    logger.info(f"Waiting {delay:.1f}s before the next individual fetch...")
+                    await asyncio.sleep(delay)
+                next_fetch_at = loop.time() + DAILY_FETCH_INTERVAL
+        
+        async def analyze_one(i: int, symbol: str) -> Optional[Dict]:
+            data = prefetched.get(symbol)
+            if data is None:
+                await pace_individual_fetch()
+            async with semaphore:
+                try:
+                    logger.info(f"Analyzing {symbol} ({i+1}/{len(INDONESIAN_STOCKS)})")
+                    return await self.analyze_stock(symbol, data=data)
+                    
+                except Exception as e:
+                    logger.error(f"Error analyzing {symbol}: {e}")
+                    return None
+        
+        results = await asyncio.gather(*(analyze_one(i, symbol) for i, symbol in enumerate(INDONESIAN_STOCKS)))
+        
+        for signal_info in results:
+            if signal_info and signal_info['signal'] in [SIGNAL_BUY, SIGNAL_SELL, SIGNAL_STRONG_SELL, SIGNAL_HOLD]:
+                # Check if signal was sent or filtered by ChatGPT
+                if signal_info.get('chatgpt_filtered', False):
+                    chatgpt_filtered += 1
+                else:
+                    signals_sent += 1
+                    chatgpt_confirmed += 1
+                    if signal_info['signal'] == SIGNAL_BUY:
+                        buy_signals += 1
+                    elif signal_info['signal'] == SIGNAL_SELL:
+                        sell_signals += 1
+                    elif signal_info['signal'] == SIGNAL_STRONG_SELL:
+                        strong_sell_signals += 1
+                    elif signal_info['signal'] == SIGNAL_HOLD:
+                        hold_signals += 1
         
         # Send summary message
         end_time = datetime.now()
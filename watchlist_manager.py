@@ -5,6 +5,7 @@ Manage your stock watchlist with real-time monitoring
 
 import asyncio
 import sys
+from collections import Counter
 from datetime import datetime, timedelta
 from trading_bot import IndonesianStockBot
 from config import WATCHLIST_STOCKS, INDONESIAN_STOCKS
@@ -15,6 +16,14 @@ class WatchlistManager:
     def __init__(self):
         self.bot = IndonesianStockBot()
     
+    async def _analyze_all(self, symbols):
+        """Analyze symbols concurrently from one batched download; failures are returned as exceptions"""
+        prefetched = await self.bot.run_blocking(self.bot.fetch_stocks_data, symbols)
+        return await asyncio.gather(
+            *(self.bot.analyze_stock(symbol, data=prefetched.get(symbol)) for symbol in symbols),
+            return_exceptions=True
+        )
+    
     async def monitor_watchlist(self, duration_minutes: int = 60):
         """Monitor watchlist stocks for specified duration"""
         print(f"🔍 WATCHLIST MONITORING STARTED")
@@ -30,9 +39,11 @@ class WatchlistManager:
         while datetime.now() < end_time:
             print(f"🕐 {datetime.now().strftime('%H:%M:%S')} - Checking watchlist...")
             
-            for symbol in WATCHLIST_STOCKS:
+            outcomes = await self._analyze_all(WATCHLIST_STOCKS)
+            for symbol, signal_info in zip(WATCHLIST_STOCKS, outcomes):
                 try:
-                    signal_info = await self.bot.analyze_stock(symbol)
+                    if isinstance(signal_info, Exception):
+                        raise signal_info
                     if signal_info:
                         # Check for significant changes
                         if signal_info['signal'] in ['BUY', 'SELL', 'STRONG_SELL']:
@@ -49,9 +60,6 @@ class WatchlistManager:
                 
                 except Exception as e:
                     print(f"❌ Error monitoring {symbol}: {e}")
-                
-                # Small delay between stocks
-                await asyncio.sleep(1)
             
             print(f"✅ Watchlist check complete. Next check in {check_interval} minutes.\n")
             
@@ -69,22 +77,19 @@ class WatchlistManager:
         print()
         
         results = []
+        outcomes = await self._analyze_all(WATCHLIST_STOCKS)
         
-        for i, symbol in enumerate(WATCHLIST_STOCKS, 1):
+        for i, (symbol, signal_info) in enumerate(zip(WATCHLIST_STOCKS, outcomes), 1):
             print(f"🔍 Analyzing {symbol} ({i}/{len(WATCHLIST_STOCKS)})...")
             
             try:
-                signal_info = await self.bot.analyze_stock(symbol)
+                if isinstance(signal_info, Exception):
+                    raise signal_info
                 if signal_info:
                     results.append(signal_info)
                     
                     # Display basic info
-                    signal_emoji = {
-                        'BUY': "🟢",
-                        'SELL': "🔴",
-                        'STRONG_SELL': "🚨",
-                        'HOLD': "🟡"
-                    }.get(signal_info['signal'], "⚪")
+                    signal_emoji = IndonesianStockBot.SIGNAL_EMOJI.get(signal_info['signal'], "⚪")
                     
                     print(f"   {signal_emoji} Signal: {signal_info['signal']}")
                     print(f"   💰 Price: {signal_info['current_price']:,} IDR ({signal_info['price_change']:+.2f}%)")
@@ -105,19 +110,18 @@ class WatchlistManager:
             except Exception as e:
                 print(f"   ❌ Error analyzing {symbol}: {e}")
                 print()
-            
-            # Delay between analyses
-            await asyncio.sleep(2)
         
         # Summary
         print("📋 WATCHLIST SUMMARY")
         print("-" * 30)
         
         if results:
-            buy_signals = len([r for r in results if r['signal'] == 'BUY'])
-            sell_signals = len([r for r in results if r['signal'] == 'SELL'])
-            strong_sell_signals = len([r for r in results if r['signal'] == 'STRONG_SELL'])
-            hold_signals = len([r for r in results if r['signal'] == 'HOLD'])
+            # One pass over the results instead of a filtered list per signal type
+            signal_counts = Counter(r['signal'] for r in results)
+            buy_signals = signal_counts['BUY']
+            sell_signals = signal_counts['SELL']
+            strong_sell_signals = signal_counts['STRONG_SELL']
+            hold_signals = signal_counts['HOLD']
             
             print(f"🟢 Buy Signals: {buy_signals}")
             print(f"🔴 Sell Signals: {sell_signals}")